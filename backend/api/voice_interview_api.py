@@ -7,58 +7,81 @@ import os
 import sys
 import uuid
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, TypedDict
 from datetime import datetime
-import json
+import asyncio
+import copy
+import hashlib
+import logging
+import random
+import re
+from bisect import bisect_left, bisect_right
 import tempfile
 import time
+from collections import defaultdict, deque
+from functools import lru_cache
+from itertools import chain, islice
 
+import numpy as np
 from fastapi import HTTPException, UploadFile
 from pydantic import BaseModel
 import google.generativeai as genai
+import orjson
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 # Add project root to Python path
 project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
-# Import CampusHire modules
-MODULES_STATUS = {
-    "parser": False,
-    "matcher": False,
-    "reporter": False,
-    "evaluator": False
-}
-
-# Try importing core modules
-try:
-    from backend.parser.extract_resume import extract_text_from_pdf, extract_entities
-    MODULES_STATUS["parser"] = True
-    print("✅ Resume parser imported successfully")
-except ImportError as e:
-    print(f"⚠️ Resume parser unavailable: {e}")
-
-try:
-    from backend.matcher.semantic_ranker import create_resume_profile, calculate_match_score
-    MODULES_STATUS["matcher"] = True
-    print("✅ Semantic matcher imported successfully")
-except ImportError as e:
-    print(f"⚠️ Semantic matcher unavailable: {e}")
-
-try:
-    from backend.report.report_generator import InterviewReportGenerator
-    MODULES_STATUS["reporter"] = True
-    print(" Report generator imported successfully")
-except ImportError as e:
-    print(f"⚠️ Report generator unavailable: {e}")
-
-# Replace the evaluator import section with this:
-try:
-    from backend.scoring.evaluator import InterviewEvaluator  # Fixed import path
-    MODULES_STATUS["evaluator"] = True
-    print(" Advanced evaluator imported successfully")
-except ImportError as e:
-    print(f" Advanced evaluator unavailable: {e}")
+# Import CampusHire modules. The probe is cached so that re-running it (e.g.
+# from the startup hooks of several app instances) never repeats the imports.
+@lru_cache(maxsize=1)
+def probe_modules() -> Dict[str, bool]:
+    """Try importing each optional CampusHire module exactly once."""
+    global extract_text_from_pdf, extract_entities
+    global create_resume_profile, calculate_match_score
+    global InterviewReportGenerator, InterviewEvaluator
+
+    status = {
+        "parser": False,
+        "matcher": False,
+        "reporter": False,
+        "evaluator": False
+    }
+
+    try:
+        from backend.parser.extract_resume import extract_text_from_pdf, extract_entities
+        status["parser"] = True
+        logger.debug("Resume parser imported successfully")
+    except ImportError as e:
+        logger.warning("Resume parser unavailable: %s", e)
+
+    try:
+        from backend.matcher.semantic_ranker import create_resume_profile, calculate_match_score
+        status["matcher"] = True
+        logger.debug("Semantic matcher imported successfully")
+    except ImportError as e:
+        logger.warning("Semantic matcher unavailable: %s", e)
+
+    try:
+        from backend.report.report_generator import InterviewReportGenerator
+        status["reporter"] = True
+        logger.debug("Report generator imported successfully")
+    except ImportError as e:
+        logger.warning("Report generator unavailable: %s", e)
+
+    try:
+        from backend.scoring.evaluator import InterviewEvaluator
+        status["evaluator"] = True
+        logger.debug("Advanced evaluator imported successfully")
+    except ImportError as e:
+        logger.warning("Advanced evaluator unavailable: %s", e)
+
+    return status
+
+MODULES_STATUS = probe_modules()
 
 
 # Load environment variables
@@ -67,9 +90,9 @@ gemini_api_key = os.getenv('GEMINI_API_KEY')
 
 if gemini_api_key:
     genai.configure(api_key="GEMINI_API_KEY")
-    print("✅ Gemini AI configured successfully")
+    logger.info("Gemini AI configured successfully")
 else:
-    print("⚠️ Warning: GEMINI_API_KEY not found in .env file")
+    logger.warning("GEMINI_API_KEY not found in .env file")
 
 # Pydantic Models
 class InterviewSessionCreate(BaseModel):
@@ -87,9 +110,269 @@ class ResponseSubmission(BaseModel):
     response_text: str
     audio_duration: Optional[float] = 0
 
-# Global storage
-active_sessions: Dict[str, Dict] = {}
-session_storage: Dict[str, Dict] = {}
+class SessionRecord(TypedDict, total=False):
+    """Schema of one interview session.
+
+    Kept as a dict at runtime (sessions are serialized as-is into reports
+    and mutated with dict idioms throughout); this type pins down the keys
+    for readers and checkers.
+    """
+    session_id: str
+    candidate_name: str
+    job_description: str
+    created_at: datetime
+    status: str
+    current_question: int
+    total_questions: int
+    candidate_data: Optional[Dict]
+    resume_match_score: float
+    resume_processing_log: Dict[str, Any]
+    questions_asked: List[Dict]
+    questions_by_id: Dict[str, Dict]
+    responses: List[Dict]
+    recent_responses: deque
+    response_columns: Dict[str, List]
+    question_flow: List[str]
+    modules_available: Dict[str, bool]
+    ai_model_available: bool
+    privacy_compliant: bool
+    data_retention_policy: str
+    _prefetched_question: tuple
+    _pending_evals: List[Dict]
+
+# Global storage: one dict is the single source of truth for sessions; the
+# status index below provides the filtered views
+active_sessions: Dict[str, SessionRecord] = {}
+
+# Secondary index: status -> set of session ids, so filtered listings are
+# O(result) instead of scanning every session
+_sessions_by_status: Dict[str, set] = defaultdict(set)
+
+# Guards the compound store-plus-index updates so concurrent requests on the
+# event loop never observe a session without its index entry
+_sessions_lock = asyncio.Lock()
+
+# Feedback messages bucketed by score, built once: index i holds the messages
+# for scores below _FEEDBACK_THRESHOLDS[i] (last bucket catches the rest)
+_FEEDBACK_THRESHOLDS = (4, 6, 8)
+_FEEDBACK_MESSAGES = (
+    (  # below_average: score < 4
+        "Thank you for sharing that. In future responses, try to include specific examples and more detailed explanations.",
+        "I appreciate your input. Consider providing more depth and concrete examples to showcase your experience.",
+        "Thanks for your response. Adding specific situations and outcomes would strengthen your answers."
+    ),
+    (  # average: 4 <= score < 6
+        "Thank you for that response. Consider adding more specific examples to strengthen your answer.",
+        "I appreciate your answer. Adding more technical details or metrics would make it even stronger.",
+        "Good start on that response. More concrete examples would help demonstrate your experience better."
+    ),
+    (  # good: 6 <= score < 8
+        "Great response! You provided good insights and relevant examples that show your experience clearly.",
+        "Nice answer! Your explanation demonstrates solid understanding and practical knowledge.",
+        "Good response! The examples you shared effectively illustrate your capabilities."
+    ),
+    (  # excellent: score >= 8
+        "Excellent response! Your detailed explanation and specific examples really demonstrate strong experience in this area.",
+        "Outstanding answer! The technical depth and practical examples you provided show impressive expertise.",
+        "Fantastic response! Your approach shows both technical competence and strategic thinking."
+    )
+)
+
+# Precompiled keyword scans for the rule-based fallback evaluation; a single
+# regex pass replaces repeated substring searches over a fresh lowercase copy
+_EXAMPLE_TERMS_RE = re.compile(r"example|project|experience|when i|i worked")
+_TECHNICAL_TERMS_RE = re.compile(r"algorithm|database|api|framework|architecture")
+_DIGIT_RE = re.compile(r"\d")
+
+# Leadership detection works on whole lowercase tokens: one tokenization
+# serves the predicate as an O(1) set intersection and respects word
+# boundaries, unlike the old substring scan that matched e.g. "mislead"
+_LEADERSHIP_WORDS = frozenset({
+    "lead", "leads", "led", "leading", "leader", "leaders", "leadership",
+    "manage", "managed", "managing", "manager", "managers", "management"
+})
+
+# Deferred evaluation mode: when enabled, submit_response returns an
+# immediate heuristic score and Gemini evaluations run in the background in
+# batches of _EVAL_BATCH_SIZE, amortizing per-request overhead and keeping
+# evaluation latency off the candidate's critical path
+DEFERRED_EVALUATION = os.getenv("DEFERRED_EVALUATION", "false").lower() == "true"
+_EVAL_BATCH_SIZE = 3
+
+# Resume upload limits: uploads are streamed to a temp file in
+# _UPLOAD_CHUNK_BYTES pieces and rejected once MAX_RESUME_BYTES is exceeded
+_UPLOAD_CHUNK_BYTES = 64 * 1024
+MAX_RESUME_BYTES = 10 * 1024 * 1024
+
+# The evaluation rubric never changes between calls, so it is built once here
+# instead of being re-interpolated into every evaluation prompt
+_EVALUATION_RUBRIC = """
+        Evaluate across these dimensions and provide valid JSON only:
+
+        {
+            "overall_score": [1-10 integer],
+            "technical_depth": [1-5 integer],
+            "communication_clarity": [1-5 integer],
+            "relevance_to_role": [1-5 integer],
+            "specific_examples": [1-5 integer],
+            "problem_solving_approach": [1-5 integer],
+            "strengths": ["strength1", "strength2", "strength3"],
+            "improvements": ["improvement1", "improvement2"],
+            "technical_keywords_used": ["keyword1", "keyword2"],
+            "demonstrates_experience": [true/false],
+            "shows_leadership": [true/false],
+            "mentions_metrics": [true/false],
+            "brief_feedback": "Constructive feedback for candidate (2-3 sentences)"
+        }
+
+        Scoring Guidelines:
+        - Overall: 8-10 (exceptional), 6-7 (good), 4-5 (average), 1-3 (poor)
+        - Consider depth, clarity, examples, and relevance
+        - Be objective but constructive
+        - Look for specific experiences and concrete examples
+        """
+
+# Resume analysis caches keyed by the sha256 of the uploaded PDF bytes: the
+# extracted (text, entities) pair, and match scores per (resume, job
+# description) pair. Both are bounded with oldest-first eviction.
+_resume_analysis_cache: Dict[str, tuple] = {}
+_match_score_cache: Dict[tuple, float] = {}
+_RESUME_CACHE_MAX = 128
+
+# Generated-question cache keyed by a hash of (category, prompt context);
+# evicts oldest entries first once full
+_question_cache: Dict[str, str] = {}
+_QUESTION_CACHE_MAX = 512
+
+# Evaluation cache keyed by a hash of (category, question, response): an
+# identical answer to an identical question scores the same, so repeated
+# submissions skip the Gemini call
+_evaluation_cache: Dict[str, Dict] = {}
+_EVALUATION_CACHE_MAX = 1024
+
+def _fast_uuid() -> str:
+    """Random id from one urandom read, skipping the uuid4 wrapper overhead."""
+    return uuid.UUID(bytes=os.urandom(16), version=4).hex
+
+@lru_cache(maxsize=1)
+def _iso_from_epoch(epoch_s: int) -> str:
+    return datetime.fromtimestamp(epoch_s).isoformat()
+
+def _iso_now() -> str:
+    """Second-resolution ISO timestamp; the strftime pass runs at most once
+    per second regardless of how many turns are processed."""
+    return _iso_from_epoch(time.time_ns() // 1_000_000_000)
+
+def _word_count(text: str) -> int:
+    """Count words without allocating a list of substrings.
+
+    bytes.count runs as a single C-level scan, so for long voice transcripts
+    this is far cheaper than len(text.split()). Runs of whitespace overcount
+    slightly, which is fine for the scoring bands it feeds.
+    """
+    encoded = text.encode()
+    return encoded.count(b" ") + (1 if encoded else 0)
+
+# Threshold ladders used by report analytics: bisecting the sorted thresholds
+# indexes straight into the matching label, replacing if/elif chains. Ladders
+# written with >= use bisect_right; the strictly-> ladder uses bisect_left.
+_REC_THRESHOLDS = (5, 6, 7, 8)
+_REC_VALUES = (
+    ("Pass", "High"), ("Maybe", "Medium"), ("Hire", "Medium"),
+    ("Hire", "High"), ("Strong Hire", "High")
+)
+_SCORE_LEVEL_THRESHOLDS = (4, 6, 8)
+_SCORE_LEVELS = ("Needs Improvement", "Average", "Good", "Excellent")
+_SALARY_THRESHOLDS = (5.5, 6.5, 7.5, 8.5)
+_SALARY_BANDS = (
+    "Entry level - requires development",
+    "Lower-mid band - growth potential",
+    "Mid band - solid contributor",
+    "Upper band - strong performer",
+    "Top of band - exceptional candidate"
+)
+_COMM_STYLE_THRESHOLDS = (20, 40, 80)
+_COMM_STYLES = ("Brief responses", "Concise", "Balanced and clear", "Detailed and thorough")
+_TECH_LEVEL_THRESHOLDS = (2.5, 3.5, 4.5)
+_TECH_LEVELS = ("Beginner", "Intermediate", "Advanced", "Expert")
+
+# Pure functions of quantized scores: caching makes repeat reports in batch
+# scoring pipelines hit precomputed strings instead of re-walking the ladders
+@lru_cache(maxsize=256)
+def _salary_band_for(score_q: float) -> str:
+    return _SALARY_BANDS[bisect_right(_SALARY_THRESHOLDS, score_q)]
+
+@lru_cache(maxsize=256)
+def _impression_for(score_q: float, consistency_q: float) -> str:
+    if score_q >= 8 and consistency_q >= 0.8:
+        return "Exceptional candidate with consistently high performance across all areas. Demonstrates strong technical skills and excellent communication."
+    elif score_q >= 7 and consistency_q >= 0.7:
+        return "Strong candidate with solid performance. Shows good technical competency and effective communication skills."
+    elif score_q >= 6:
+        return "Competent candidate with decent performance. Has potential but may need some development in key areas."
+    elif score_q >= 4:
+        return "Average candidate with mixed performance. Shows some promise but requires significant development."
+    else:
+        return "Candidate performance below expectations. Would need substantial development to meet role requirements."
+
+def _first_unique(iterable, n: int) -> List:
+    """First n unique items in order, stopping as soon as n are found."""
+    seen = set()
+    out = []
+    for item in iterable:
+        if item not in seen:
+            seen.add(item)
+            out.append(item)
+            if len(out) == n:
+                break
+    return out
+
+def get_session(session_id: str) -> SessionRecord:
+    """Fetch a session by id (O(1) lookup) or raise 404."""
+    session = active_sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Interview session not found")
+    return session
+
+def _set_session_status(session: SessionRecord, new_status: str) -> None:
+    """Change a session's status and keep the status index in sync."""
+    old_status = session.get("status")
+    session_id = session["session_id"]
+    if old_status:
+        _sessions_by_status[old_status].discard(session_id)
+    session["status"] = new_status
+    _sessions_by_status[new_status].add(session_id)
+
+@lru_cache(maxsize=1)
+def _init_gemini():
+    """Construct the Gemini model and generation configs exactly once.
+
+    Model construction does SDK state setup, so every VoiceInterviewAPI
+    instance shares these objects. Returns None when Gemini is unavailable.
+    The generation settings never change per call:
+    - question generation: short output, higher temperature
+    - evaluation: structured JSON, low temperature
+    - batch evaluation: one object per response, larger output budget
+    """
+    try:
+        model = genai.GenerativeModel('gemini-1.5-flash')
+        question_config = genai.types.GenerationConfig(
+            max_output_tokens=150,
+            temperature=0.7
+        )
+        eval_config = genai.types.GenerationConfig(
+            max_output_tokens=400,
+            temperature=0.3
+        )
+        batch_eval_config = genai.types.GenerationConfig(
+            max_output_tokens=400 * _EVAL_BATCH_SIZE,
+            temperature=0.3
+        )
+        logger.info("Gemini model initialized")
+        return model, question_config, eval_config, batch_eval_config
+    except Exception as e:
+        logger.error("Failed to initialize Gemini model: %s", e)
+        return None
 
 class VoiceInterviewAPI:
     """
@@ -98,13 +381,14 @@ class VoiceInterviewAPI:
     """
     
     def __init__(self):
-        # Initialize AI model
-        try:
-            self.model = genai.GenerativeModel('gemini-pro')
+        # Bind the shared Gemini model and generation configs; the cached
+        # factory means repeated instantiation never repeats SDK setup
+        gemini = _init_gemini()
+        if gemini is not None:
+            (self.model, self.question_gen_config,
+             self.eval_gen_config, self.batch_eval_gen_config) = gemini
             self.ai_available = True
-            print("✅ Gemini Pro model initialized")
-        except Exception as e:
-            print(f"❌ Failed to initialize Gemini model: {e}")
+        else:
             self.model = None
             self.ai_available = False
         
@@ -115,16 +399,16 @@ class VoiceInterviewAPI:
         if MODULES_STATUS["evaluator"]:
             try:
                 self.evaluator = InterviewEvaluator()
-                print("✅ Advanced evaluator initialized")
+                logger.debug("Advanced evaluator initialized")
             except Exception as e:
-                print(f"❌ Evaluator initialization failed: {e}")
+                logger.error("Evaluator initialization failed: %s", e)
         
         if MODULES_STATUS["reporter"]:
             try:
                 self.report_generator = InterviewReportGenerator()
-                print("✅ Report generator initialized")
+                logger.debug("Report generator initialized")
             except Exception as e:
-                print(f"❌ Report generator initialization failed: {e}")
+                logger.error("Report generator initialization failed: %s", e)
         
         # Enhanced question categories
         self.question_categories = {
@@ -171,8 +455,8 @@ class VoiceInterviewAPI:
     async def create_session(self, session_data: InterviewSessionCreate, resume_file: Optional[UploadFile] = None) -> Dict:
         """Create comprehensive interview session with full integration"""
         
-        session_id = str(uuid.uuid4())
-        print(f"🎯 Creating interview session: {session_id}")
+        session_id = _fast_uuid()
+        logger.info("Creating interview session: %s", session_id)
         
         # Process resume with enhanced analysis
         candidate_data = None
@@ -187,52 +471,94 @@ class VoiceInterviewAPI:
         
         if resume_file and MODULES_STATUS["parser"]:
             try:
-                print(f"📄 Processing resume: {resume_file.filename}")
+                logger.info("Processing resume: %s", resume_file.filename)
                 processing_log["processing_status"] = "processing"
                 
-                # Secure temporary processing
+                # Secure temporary processing: stream the upload in chunks so we
+                # never hold the whole PDF in memory and can reject oversized
+                # files before the full transfer completes
+                total_bytes = 0
+                hasher = hashlib.sha256()
                 with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf", prefix="secure_interview_") as temp_file:
-                    content = await resume_file.read()
-                    temp_file.write(content)
                     temp_path = temp_file.name
-                
-                print(f"📝 Extracting text from resume...")
-                resume_text = extract_text_from_pdf(temp_path)
-                
+                    while chunk := await resume_file.read(_UPLOAD_CHUNK_BYTES):
+                        total_bytes += len(chunk)
+                        if total_bytes > MAX_RESUME_BYTES:
+                            raise HTTPException(status_code=413, detail="Resume file too large (max 10 MB)")
+                        hasher.update(chunk)
+                        temp_file.write(chunk)
+                resume_digest = hasher.hexdigest()
+
+                # The same PDF is often submitted across sessions (re-runs,
+                # multiple roles), so extraction results are cached by the
+                # content hash computed during streaming
+                cached_analysis = _resume_analysis_cache.get(resume_digest)
+                if cached_analysis is not None:
+                    logger.debug("Resume analysis cache hit")
+                    resume_text, cached_entities = cached_analysis
+                    candidate_data = copy.deepcopy(cached_entities)
+                else:
+                    logger.debug("Extracting text from resume...")
+                    # PDF extraction, NER and embedding inference are blocking;
+                    # run them in worker threads so the event loop stays free
+                    resume_text = await asyncio.to_thread(extract_text_from_pdf, temp_path)
+                    if resume_text:
+                        logger.debug("Analyzing resume content...")
+                        candidate_data = await asyncio.to_thread(extract_entities, resume_text)
+                        if len(_resume_analysis_cache) >= _RESUME_CACHE_MAX:
+                            _resume_analysis_cache.pop(next(iter(_resume_analysis_cache)))
+                        _resume_analysis_cache[resume_digest] = (resume_text, copy.deepcopy(candidate_data))
+
                 if resume_text:
-                    print(f"🔍 Analyzing resume content...")
-                    candidate_data = extract_entities(resume_text)
                     processing_log["extraction_successful"] = True
-                    
+
                     skills_count = len(candidate_data.get('skills', []))
                     orgs_count = len(candidate_data.get('organizations', []))
-                    print(f"✅ Extracted: {skills_count} skills, {orgs_count} organizations")
-                    
-                    # Calculate semantic match with job description
+                    logger.info("Extracted %d skills, %d organizations", skills_count, orgs_count)
+
+                    # Calculate semantic match with job description; scores are
+                    # cached per (resume, job description) pair
                     if session_data.job_description and candidate_data and MODULES_STATUS["matcher"]:
-                        print(f"🎯 Calculating resume-job match...")
-                        resume_profile = create_resume_profile(candidate_data)
-                        resume_match_score = calculate_match_score(
-                            resume_profile, session_data.job_description
-                        )
+                        score_key = (resume_digest, hashlib.sha256(session_data.job_description.encode("utf-8")).hexdigest())
+                        cached_score = _match_score_cache.get(score_key)
+                        if cached_score is not None:
+                            resume_match_score = cached_score
+                        else:
+                            logger.debug("Calculating resume-job match...")
+                            resume_profile = create_resume_profile(candidate_data)
+                            resume_match_score = await asyncio.to_thread(
+                                calculate_match_score, resume_profile, session_data.job_description
+                            )
+                            if len(_match_score_cache) >= _RESUME_CACHE_MAX:
+                                _match_score_cache.pop(next(iter(_match_score_cache)))
+                            _match_score_cache[score_key] = resume_match_score
                         processing_log["match_calculation"] = True
-                        print(f"📊 Match score: {resume_match_score:.1f}%")
+                        logger.info("Match score: %.1f%%", resume_match_score)
                 else:
                     processing_log["processing_status"] = "extraction_failed"
                 
-                # Secure file deletion with overwrite
+                # Secure file deletion: overwrite in bounded chunks so the
+                # random buffer never mirrors the whole file in memory
                 if os.path.exists(temp_path):
-                    file_size = os.path.getsize(temp_path)
+                    remaining = os.path.getsize(temp_path)
                     with open(temp_path, "r+b") as f:
-                        f.write(os.urandom(file_size))
+                        while remaining > 0:
+                            block = min(remaining, 1024 * 1024)
+                            f.write(os.urandom(block))
+                            remaining -= block
                         f.flush()
                         os.fsync(f.fileno())
                     os.unlink(temp_path)
                     processing_log["secure_deletion"] = True
-                    print("🔒 Resume file securely deleted")
+                    logger.debug("Resume file securely deleted")
                 
+            except HTTPException:
+                # Propagate client errors (e.g. oversized upload) after cleanup
+                if 'temp_path' in locals() and os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
             except Exception as e:
-                print(f"❌ Resume processing error: {e}")
+                logger.exception("Resume processing error")
                 processing_log["processing_status"] = f"error: {str(e)}"
                 # Ensure cleanup on error
                 if 'temp_path' in locals() and os.path.exists(temp_path):
@@ -255,7 +581,11 @@ class VoiceInterviewAPI:
             
             # Interview data
             "questions_asked": [],
+            "questions_by_id": {},
             "responses": [],
+            # Rolling window of pre-truncated previews for question context;
+            # the deque caps itself so no [-3:] slicing is ever needed
+            "recent_responses": deque(maxlen=3),
             "question_flow": ['introduction', 'technical', 'behavioral', 'problem_solving', 'role_specific'] * 2,
             
             # System metadata
@@ -265,11 +595,17 @@ class VoiceInterviewAPI:
             "data_retention_policy": "structured_data_only"
         }
         
-        # Store session
-        active_sessions[session_id] = session
-        session_storage[session_id] = session
+        # Store session and index entry atomically with respect to the loop
+        async with _sessions_lock:
+            active_sessions[session_id] = session
+            _sessions_by_status["active"].add(session_id)
         
-        print(f"✅ Session created for {session['candidate_name']}")
+        # Warm the question cache for the planned categories in the
+        # background; the candidate reads the greeting meanwhile
+        if self.ai_available:
+            asyncio.create_task(self._pregenerate_questions(session))
+
+        logger.info("Session created for %s", session['candidate_name'])
         
         return {
             "session_id": session_id,
@@ -288,14 +624,35 @@ class VoiceInterviewAPI:
             "message": f"Interview session ready for {session['candidate_name']}"
         }
 
+    def list_sessions(self, status: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """List session summaries, filtering by status before truncating.
+
+        Uses the status index for filtered queries and islice for the limit,
+        so no full list of sessions is ever materialized.
+        """
+        if status:
+            session_ids = islice(_sessions_by_status.get(status, ()), limit)
+            sessions = (active_sessions[sid] for sid in session_ids if sid in active_sessions)
+        else:
+            sessions = islice(active_sessions.values(), limit)
+
+        return [
+            {
+                "session_id": session["session_id"],
+                "candidate_name": session["candidate_name"],
+                "status": session["status"],
+                "current_question": session["current_question"],
+                "total_questions": session["total_questions"],
+                "created_at": session["created_at"].isoformat()
+            }
+            for session in sessions
+        ]
+
     async def generate_question(self, session_id: str, category: Optional[str] = None) -> Dict:
         """Generate intelligent, personalized interview questions"""
         
-        if session_id not in active_sessions:
-            raise HTTPException(status_code=404, detail="Interview session not found")
-        
-        session = active_sessions[session_id]
-        
+        session = get_session(session_id)
+
         if session["status"] != "active":
             raise HTTPException(status_code=400, detail="Interview session is not active")
         
@@ -303,7 +660,7 @@ class VoiceInterviewAPI:
         
         # Check completion
         if current_q_num >= session["total_questions"]:
-            session["status"] = "completed"
+            _set_session_status(session, "completed")
             return {
                 "status": "interview_completed",
                 "session_id": session_id,
@@ -317,41 +674,43 @@ class VoiceInterviewAPI:
         
         # Determine question category intelligently
         if not category:
-            flow = session["question_flow"]
-            if current_q_num < len(flow):
-                category = flow[current_q_num]
-            else:
-                # Fallback for extra questions
-                category = "technical" if current_q_num % 2 == 0 else "behavioral"
-        
-        # Generate question
+            category = self._next_category(session)
+
+        # Generate question, consuming the prefetch started during the
+        # previous response submission when it matches this slot
+        prefetched = session.pop("_prefetched_question", None)
         if current_q_num == 0:
             question_text = "Hello! Thank you for taking the time to interview with us today. To start, please tell me about yourself, your background, and what brings you to this opportunity."
+        elif prefetched and prefetched[0] == current_q_num and prefetched[1] == category:
+            question_text = await prefetched[2]
         else:
+            if prefetched:
+                prefetched[2].cancel()
             question_text = await self._generate_intelligent_question(
                 category,
                 session["job_description"],
                 session["candidate_data"],
-                session.get("responses", [])
+                session.get("recent_responses", ())
             )
         
         # Create question object with metadata
-        question_id = str(uuid.uuid4())
+        question_id = _fast_uuid()
         question_obj = {
             "question_id": question_id,
             "question_text": question_text,
             "category": category,
             "question_number": current_q_num + 1,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": _iso_now(),
             "personalization_used": session["candidate_data"] is not None,
             "ai_generated": self.ai_available
         }
         
-        # Update session
+        # Update session (the id index keeps response lookups O(1))
         session["questions_asked"].append(question_obj)
+        session.setdefault("questions_by_id", {})[question_id] = question_obj
         session["current_question"] = current_q_num + 1
         
-        print(f"❓ Q{current_q_num + 1}/{session['total_questions']} ({category}) for {session_id[:8]}...")
+        logger.info("Q%d/%d (%s) for %s", current_q_num + 1, session['total_questions'], category, session_id[:8])
         
         return {
             "question_id": question_id,
@@ -364,12 +723,40 @@ class VoiceInterviewAPI:
             "personalized": session["candidate_data"] is not None
         }
 
+    async def _pregenerate_questions(self, session: SessionRecord) -> None:
+        """Generate questions for every planned category concurrently.
+
+        All prompts share the session's initial context, so one gather hides
+        N Gemini round-trips behind the slowest one and fills the question
+        cache; generate_question then hits the cache until the evolving
+        discussion changes the context (at which point the per-submission
+        prefetch takes over). Failures fall through to on-demand generation.
+        """
+        flow = session["question_flow"][1:session["total_questions"]]
+        await asyncio.gather(*(
+            self._generate_intelligent_question(
+                category,
+                session["job_description"],
+                session["candidate_data"],
+                session.get("recent_responses", ())
+            )
+            for category in dict.fromkeys(flow)
+        ), return_exceptions=True)
+
+    def _next_category(self, session: Dict) -> str:
+        """Pick the category for the session's next question slot."""
+        current_q_num = session["current_question"]
+        flow = session["question_flow"]
+        if current_q_num < len(flow):
+            return flow[current_q_num]
+        # Fallback for extra questions
+        return "technical" if current_q_num % 2 == 0 else "behavioral"
+
     async def _generate_intelligent_question(self, category: str, job_description: str,
-                                           candidate_data: Dict, previous_responses: List) -> str:
+                                           candidate_data: Dict, recent_responses) -> str:
         """Generate AI-powered intelligent questions with context awareness"""
         
         if not self.ai_available:
-            import random
             return random.choice(self.question_categories.get(category, self.question_categories["introduction"]))
         
         # Build comprehensive context
@@ -379,26 +766,36 @@ class VoiceInterviewAPI:
             context_parts.append(f"Job Requirements: {job_description[:600]}")
         
         if candidate_data:
-            skills = candidate_data.get('skills', [])[:15]  # Top 15 skills
-            orgs = candidate_data.get('organizations', [])[:8]  # Top 8 organizations
-            
-            if skills:
-                context_parts.append(f"Candidate Skills: {', '.join(skills)}")
-            if orgs:
-                context_parts.append(f"Work Experience: {', '.join(orgs)}")
-        
-        if previous_responses:
-            recent_topics = []
-            for response in previous_responses[-3:]:  # Last 3 responses
-                resp_preview = response.get('response_text', '')[:150]
-                if resp_preview:
-                    recent_topics.append(f"- {response.get('category', 'General')}: {resp_preview}")
-            
+            # islice feeds the join directly without materializing a
+            # truncated copy of potentially long entity lists
+            skills_str = ', '.join(islice(candidate_data.get('skills') or (), 15))
+            orgs_str = ', '.join(islice(candidate_data.get('organizations') or (), 8))
+
+            if skills_str:
+                context_parts.append(f"Candidate Skills: {skills_str}")
+            if orgs_str:
+                context_parts.append(f"Work Experience: {orgs_str}")
+        
+        if recent_responses:
+            # Previews were truncated at write time, so this is slice-free
+            recent_topics = [
+                f"- {response.get('category', 'General')}: {response['preview']}"
+                for response in recent_responses if response.get('preview')
+            ]
             if recent_topics:
                 context_parts.append(f"Recent Discussion:\n{chr(10).join(recent_topics)}")
         
         context = "\n\n".join(context_parts)
-        
+
+        # Reuse a previously generated question for an identical context:
+        # repeat interviews against the same job description and resume are
+        # common and the prompt is fully determined by (category, context)
+        cache_key = hashlib.sha256(f"{category}\x00{context}".encode("utf-8")).hexdigest()
+        cached_question = _question_cache.get(cache_key)
+        if cached_question is not None:
+            logger.debug("Question cache hit for category %s", category)
+            return cached_question
+
         # Create intelligent prompt
         prompt = f"""
         You are conducting a {category} interview for a software engineering position.
@@ -420,12 +817,10 @@ class VoiceInterviewAPI:
         """
 
         try:
-            response = self.model.generate_content(
+            response = await asyncio.to_thread(
+                self.model.generate_content,
                 prompt,
-                generation_config=genai.types.GenerationConfig(
-                    max_output_tokens=150,
-                    temperature=0.7
-                )
+                generation_config=self.question_gen_config
             )
             
             generated_question = response.text.strip()
@@ -436,41 +831,66 @@ class VoiceInterviewAPI:
             
             if len(generated_question) < 15 or '?' not in generated_question:
                 raise ValueError("Generated question too short or invalid format")
-            
+
+            if len(_question_cache) >= _QUESTION_CACHE_MAX:
+                _question_cache.pop(next(iter(_question_cache)))
+            _question_cache[cache_key] = generated_question
+
             return generated_question
             
         except Exception as e:
-            print(f"❌ AI question generation failed: {e}")
+            logger.warning("AI question generation failed: %s", e)
             # Fallback to curated questions
-            import random
             return random.choice(self.question_categories.get(category, self.question_categories["introduction"]))
 
     async def submit_response(self, response_data: ResponseSubmission) -> Dict:
         """Process response with advanced evaluation and analysis"""
         
-        if response_data.session_id not in active_sessions:
-            raise HTTPException(status_code=404, detail="Interview session not found")
-        
-        session = active_sessions[response_data.session_id]
-        
-        # Find corresponding question
-        question = None
-        for q in session["questions_asked"]:
-            if q["question_id"] == response_data.question_id:
-                question = q
-                break
+        session = get_session(response_data.session_id)
         
+        # Find corresponding question via the per-session id index
+        question = session.get("questions_by_id", {}).get(response_data.question_id)
+
         if not question:
             raise HTTPException(status_code=400, detail="Question not found for this response")
         
-        print(f"📝 Processing response for Q{question['question_number']} ({question['category']})")
-        
-        # AI-powered evaluation
-        ai_evaluation = await self._evaluate_with_ai(
-            question["question_text"],
-            response_data.response_text,
-            question["category"]
-        )
+        logger.info("Processing response for Q%d (%s)", question['question_number'], question['category'])
+
+        # Record the preview for question context once, at write time; the
+        # deque keeps only the last three so no slicing happens on reads
+        session.setdefault("recent_responses", deque(maxlen=3)).append({
+            "category": question["category"],
+            "preview": response_data.response_text[:150]
+        })
+
+        # Kick off generation of the next question concurrently with the
+        # evaluation below
+        next_q_num = session["current_question"]
+        prefetch_task = None
+        if self.ai_available and 0 < next_q_num < session["total_questions"]:
+            next_category = self._next_category(session)
+            prefetch_task = asyncio.create_task(self._generate_intelligent_question(
+                next_category,
+                session["job_description"],
+                session["candidate_data"],
+                session["recent_responses"]
+            ))
+
+        # AI-powered evaluation. In deferred mode the candidate gets an
+        # immediate heuristic score and the Gemini evaluation is applied
+        # later by a background batch (see _batch_evaluate).
+        if DEFERRED_EVALUATION and self.ai_available:
+            ai_evaluation = self._heuristic_evaluation(response_data.response_text)
+            ai_evaluation["provisional"] = True
+        else:
+            ai_evaluation = await self._evaluate_with_ai(
+                question["question_text"],
+                response_data.response_text,
+                question["category"]
+            )
+
+        if prefetch_task is not None:
+            session["_prefetched_question"] = (next_q_num, next_category, prefetch_task)
         
         # Advanced evaluation if available
         comprehensive_evaluation = ai_evaluation
@@ -482,76 +902,79 @@ class VoiceInterviewAPI:
                     question["category"],
                     ai_evaluation
                 )
-                print("✅ Advanced evaluation completed")
+                logger.debug("Advanced evaluation completed")
             except Exception as e:
-                print(f"⚠️ Advanced evaluation failed, using AI evaluation: {e}")
+                logger.warning("Advanced evaluation failed, using AI evaluation: %s", e)
         
-        # Create comprehensive response object
+        # Create comprehensive response object. The text is scanned exactly
+        # once and every analytics field is derived from that word count.
+        response_text = response_data.response_text
+        word_count = _word_count(response_text)
         response_obj = {
             "question_id": response_data.question_id,
-            "response_text": response_data.response_text,
+            "response_text": response_text,
             "audio_duration": response_data.audio_duration,
-            "submitted_at": datetime.now().isoformat(),
-            
+            "submitted_at": _iso_now(),
+
             # Question context
             "question": question["question_text"],
             "category": question["category"],
             "question_number": question["question_number"],
-            
+
             # Evaluations
             "evaluation": comprehensive_evaluation,
             "ai_evaluation": ai_evaluation,
-            
+
             # Response analytics
             "response_analytics": {
-                "word_count": len(response_data.response_text.split()),
-                "character_count": len(response_data.response_text),
-                "estimated_speaking_time": len(response_data.response_text.split()) * 0.5,  # Rough estimate
-                "response_completeness": min(1.0, len(response_data.response_text.split()) / 50)  # Based on 50 words as "complete"
+                "word_count": word_count,
+                "character_count": len(response_text),
+                "estimated_speaking_time": word_count * 0.5,  # Rough estimate
+                "response_completeness": min(1.0, word_count / 50)  # Based on 50 words as "complete"
             }
         }
         
         session["responses"].append(response_obj)
-        
+
+        # Maintain the columnar mirror read by report analytics: each field
+        # is appended once here, so generate_final_report can build its
+        # arrays without re-walking the nested response dicts. Deferred
+        # evaluation rewrites scores after the fact, so it skips the mirror
+        # and the report falls back to a fresh extraction.
+        if not (DEFERRED_EVALUATION and self.ai_available):
+            cols = session.get("response_columns")
+            if cols is None:
+                cols = session["response_columns"] = {
+                    "overall": [], "technical": [], "communication": [],
+                    "word_counts": [], "leadership": [], "experience": [],
+                    "categories": [], "strengths": [], "improvements": [], "keywords": []
+                }
+            cols["overall"].append(float(comprehensive_evaluation.get("overall_score", 5)))
+            cols["technical"].append(float(comprehensive_evaluation.get("technical_depth", 3)))
+            cols["communication"].append(float(comprehensive_evaluation.get("communication_clarity", 3)))
+            cols["word_counts"].append(word_count)
+            cols["leadership"].append(bool(comprehensive_evaluation.get("shows_leadership", False)))
+            cols["experience"].append(bool(comprehensive_evaluation.get("demonstrates_experience", False)))
+            cols["categories"].append(question["category"])
+            cols["strengths"].append(comprehensive_evaluation.get("strengths", ()))
+            cols["improvements"].append(comprehensive_evaluation.get("improvements", ()))
+            cols["keywords"].append(comprehensive_evaluation.get("technical_keywords_used", ()))
+
+        # Queue the response for batched Gemini evaluation; flush every
+        # _EVAL_BATCH_SIZE responses or once the interview is complete
+        if DEFERRED_EVALUATION and self.ai_available:
+            pending = session.setdefault("_pending_evals", [])
+            pending.append(response_obj)
+            if len(pending) >= _EVAL_BATCH_SIZE or len(session["responses"]) >= session["total_questions"]:
+                session["_pending_evals"] = []
+                asyncio.create_task(self._batch_evaluate(pending))
+
         # Generate intelligent feedback
         score = comprehensive_evaluation.get("final_overall_score", comprehensive_evaluation.get("overall_score", 5))
         
-        feedback_messages = {
-            "excellent": [
-                "Excellent response! Your detailed explanation and specific examples really demonstrate strong experience in this area.",
-                "Outstanding answer! The technical depth and practical examples you provided show impressive expertise.",
-                "Fantastic response! Your approach shows both technical competence and strategic thinking."
-            ],
-            "good": [
-                "Great response! You provided good insights and relevant examples that show your experience clearly.",
-                "Nice answer! Your explanation demonstrates solid understanding and practical knowledge.",
-                "Good response! The examples you shared effectively illustrate your capabilities."
-            ],
-            "average": [
-                "Thank you for that response. Consider adding more specific examples to strengthen your answer.",
-                "I appreciate your answer. Adding more technical details or metrics would make it even stronger.",
-                "Good start on that response. More concrete examples would help demonstrate your experience better."
-            ],
-            "below_average": [
-                "Thank you for sharing that. In future responses, try to include specific examples and more detailed explanations.",
-                "I appreciate your input. Consider providing more depth and concrete examples to showcase your experience.",
-                "Thanks for your response. Adding specific situations and outcomes would strengthen your answers."
-            ]
-        }
+        feedback = random.choice(_FEEDBACK_MESSAGES[bisect_right(_FEEDBACK_THRESHOLDS, score)])
         
-        if score >= 8:
-            feedback_category = "excellent"
-        elif score >= 6:
-            feedback_category = "good"
-        elif score >= 4:
-            feedback_category = "average"
-        else:
-            feedback_category = "below_average"
-        
-        import random
-        feedback = random.choice(feedback_messages[feedback_category])
-        
-        print(f"📊 Response scored: {score:.1f}/10")
+        logger.info("Response scored: %.1f/10", score)
         
         return {
             "status": "response_recorded",
@@ -578,18 +1001,25 @@ class VoiceInterviewAPI:
         
         if not self.ai_available:
             # Basic fallback evaluation
-            word_count = len(response.split())
+            word_count = _word_count(response)
+            response_lower = response.lower()
             return {
                 "overall_score": min(7, max(3, 3 + word_count // 20)),
                 "technical_depth": 3,
                 "communication_clarity": 3,
                 "relevance_to_role": 3,
-                "specific_examples": 2 if "example" in response.lower() or "project" in response.lower() else 1,
+                "specific_examples": 2 if _EXAMPLE_TERMS_RE.search(response_lower) else 1,
                 "strengths": ["Provided response"],
                 "improvements": ["Could provide more detail"],
                 "brief_feedback": "Thank you for your response."
             }
         
+        cache_key = hashlib.sha256(f"{category}\x00{question}\x00{response}".encode("utf-8")).hexdigest()
+        cached_evaluation = _evaluation_cache.get(cache_key)
+        if cached_evaluation is not None:
+            logger.debug("Evaluation cache hit for category %s", category)
+            return dict(cached_evaluation)
+
         evaluation_prompt = f"""
         You are an expert technical interviewer evaluating this candidate response.
 
@@ -597,39 +1027,13 @@ class VoiceInterviewAPI:
         - Category: {category}
         - Question: "{question}"
         - Candidate Response: "{response}"
-
-        Evaluate across these dimensions and provide valid JSON only:
-
-        {{
-            "overall_score": [1-10 integer],
-            "technical_depth": [1-5 integer],
-            "communication_clarity": [1-5 integer],
-            "relevance_to_role": [1-5 integer],
-            "specific_examples": [1-5 integer],
-            "problem_solving_approach": [1-5 integer],
-            "strengths": ["strength1", "strength2", "strength3"],
-            "improvements": ["improvement1", "improvement2"],
-            "technical_keywords_used": ["keyword1", "keyword2"],
-            "demonstrates_experience": [true/false],
-            "shows_leadership": [true/false],
-            "mentions_metrics": [true/false],
-            "brief_feedback": "Constructive feedback for candidate (2-3 sentences)"
-        }}
-
-        Scoring Guidelines:
-        - Overall: 8-10 (exceptional), 6-7 (good), 4-5 (average), 1-3 (poor)
-        - Consider depth, clarity, examples, and relevance
-        - Be objective but constructive
-        - Look for specific experiences and concrete examples
-        """
+{_EVALUATION_RUBRIC}"""
 
         try:
-            response_obj = self.model.generate_content(
+            response_obj = await asyncio.to_thread(
+                self.model.generate_content,
                 evaluation_prompt,
-                generation_config=genai.types.GenerationConfig(
-                    max_output_tokens=400,
-                    temperature=0.3
-                )
+                generation_config=self.eval_gen_config
             )
             
             response_text = response_obj.text.strip()
@@ -640,56 +1044,113 @@ class VoiceInterviewAPI:
             
             if start_idx != -1 and end_idx != 0:
                 json_str = response_text[start_idx:end_idx]
-                evaluation = json.loads(json_str)
-                
-                # Validate and constrain scores
-                evaluation["overall_score"] = max(1, min(10, evaluation.get("overall_score", 5)))
-                evaluation["technical_depth"] = max(1, min(5, evaluation.get("technical_depth", 3)))
-                evaluation["communication_clarity"] = max(1, min(5, evaluation.get("communication_clarity", 3)))
-                evaluation["relevance_to_role"] = max(1, min(5, evaluation.get("relevance_to_role", 3)))
-                evaluation["specific_examples"] = max(1, min(5, evaluation.get("specific_examples", 2)))
-                evaluation["problem_solving_approach"] = max(1, min(5, evaluation.get("problem_solving_approach", 3)))
-                
-                # Ensure required fields exist
-                evaluation["strengths"] = evaluation.get("strengths", ["Provided response"])[:3]
-                evaluation["improvements"] = evaluation.get("improvements", ["Could provide more detail"])[:3]
-                evaluation["technical_keywords_used"] = evaluation.get("technical_keywords_used", [])[:5]
-                evaluation["brief_feedback"] = evaluation.get("brief_feedback", "Thank you for your response.")
-                
+                evaluation = self._constrain_evaluation(orjson.loads(json_str))
+
+                if len(_evaluation_cache) >= _EVALUATION_CACHE_MAX:
+                    _evaluation_cache.pop(next(iter(_evaluation_cache)))
+                _evaluation_cache[cache_key] = dict(evaluation)
+
                 return evaluation
             else:
                 raise ValueError("Invalid JSON format in AI response")
                 
         except Exception as e:
-            print(f"❌ AI evaluation failed: {e}")
-            # Enhanced fallback evaluation
-            word_count = len(response.split())
-            has_examples = any(word in response.lower() for word in ['example', 'project', 'experience', 'when i', 'i worked'])
-            has_technical_terms = any(word in response.lower() for word in ['algorithm', 'database', 'api', 'framework', 'architecture'])
-            
-            return {
-                "overall_score": min(8, max(3, 4 + (word_count // 30) + (2 if has_examples else 0) + (1 if has_technical_terms else 0))),
-                "technical_depth": 4 if has_technical_terms else 3,
-                "communication_clarity": 4 if word_count > 50 else 3,
-                "relevance_to_role": 4 if word_count > 40 else 3,
-                "specific_examples": 4 if has_examples else 2,
-                "problem_solving_approach": 3,
-                "strengths": ["Provided detailed response" if word_count > 50 else "Addressed the question"],
-                "improvements": ["Could include more specific examples" if not has_examples else "Could provide more technical depth"],
-                "technical_keywords_used": [],
-                "demonstrates_experience": has_examples,
-                "shows_leadership": "lead" in response.lower() or "manage" in response.lower(),
-                "mentions_metrics": any(char.isdigit() for char in response),
-                "brief_feedback": "Thank you for sharing your experience. Consider providing more specific examples and technical details."
-            }
+            logger.warning("AI evaluation failed: %s", e)
+            return self._heuristic_evaluation(response)
+
+    def _heuristic_evaluation(self, response: str) -> Dict:
+        """Rule-based evaluation used as fallback and as the provisional
+        score in deferred-evaluation mode."""
+        word_count = _word_count(response)
+        response_lower = response.lower()
+        has_examples = _EXAMPLE_TERMS_RE.search(response_lower) is not None
+        has_technical_terms = _TECHNICAL_TERMS_RE.search(response_lower) is not None
+
+        return {
+            "overall_score": min(8, max(3, 4 + (word_count // 30) + (2 if has_examples else 0) + (1 if has_technical_terms else 0))),
+            "technical_depth": 4 if has_technical_terms else 3,
+            "communication_clarity": 4 if word_count > 50 else 3,
+            "relevance_to_role": 4 if word_count > 40 else 3,
+            "specific_examples": 4 if has_examples else 2,
+            "problem_solving_approach": 3,
+            "strengths": ["Provided detailed response" if word_count > 50 else "Addressed the question"],
+            "improvements": ["Could include more specific examples" if not has_examples else "Could provide more technical depth"],
+            "technical_keywords_used": [],
+            "demonstrates_experience": has_examples,
+            "shows_leadership": not _LEADERSHIP_WORDS.isdisjoint(response_lower.split()),
+            "mentions_metrics": _DIGIT_RE.search(response) is not None,
+            "brief_feedback": "Thank you for sharing your experience. Consider providing more specific examples and technical details."
+        }
+
+    @staticmethod
+    def _constrain_evaluation(evaluation: Dict) -> Dict:
+        """Clamp model-produced scores and fill required fields in place."""
+        evaluation["overall_score"] = max(1, min(10, evaluation.get("overall_score", 5)))
+        evaluation["technical_depth"] = max(1, min(5, evaluation.get("technical_depth", 3)))
+        evaluation["communication_clarity"] = max(1, min(5, evaluation.get("communication_clarity", 3)))
+        evaluation["relevance_to_role"] = max(1, min(5, evaluation.get("relevance_to_role", 3)))
+        evaluation["specific_examples"] = max(1, min(5, evaluation.get("specific_examples", 2)))
+        evaluation["problem_solving_approach"] = max(1, min(5, evaluation.get("problem_solving_approach", 3)))
+
+        evaluation["strengths"] = evaluation.get("strengths", ["Provided response"])[:3]
+        evaluation["improvements"] = evaluation.get("improvements", ["Could provide more detail"])[:3]
+        evaluation["technical_keywords_used"] = evaluation.get("technical_keywords_used", [])[:5]
+        evaluation["brief_feedback"] = evaluation.get("brief_feedback", "Thank you for your response.")
+        return evaluation
+
+    async def _batch_evaluate(self, pending: List[Dict]) -> None:
+        """Evaluate several responses with one Gemini request.
+
+        Sends all buffered (question, response) pairs in a single prompt and
+        asks for a JSON array of evaluations, then swaps each result in for
+        the provisional heuristic score. A failed batch keeps the provisional
+        scores, so candidates are never blocked on this path.
+        """
+        if not pending:
+            return
+
+        numbered_pairs = "\n\n".join(
+            f'Response {i}:\n- Category: {resp["category"]}\n'
+            f'- Question: "{resp["question"]}"\n'
+            f'- Candidate Response: "{resp["response_text"]}"'
+            for i, resp in enumerate(pending, start=1)
+        )
+        batch_prompt = f"""
+        You are an expert technical interviewer evaluating {len(pending)} candidate responses.
+
+{numbered_pairs}
+
+        Return ONLY a JSON array with exactly one evaluation object per response, in order.
+        Each object must follow this schema:
+{_EVALUATION_RUBRIC}"""
+
+        try:
+            response_obj = await asyncio.to_thread(
+                self.model.generate_content,
+                batch_prompt,
+                generation_config=self.batch_eval_gen_config
+            )
+            response_text = response_obj.text.strip()
+            start_idx = response_text.find('[')
+            end_idx = response_text.rfind(']') + 1
+            if start_idx == -1 or end_idx == 0:
+                raise ValueError("Invalid JSON array in AI response")
+
+            evaluations = orjson.loads(response_text[start_idx:end_idx])
+            for resp, evaluation in zip(pending, evaluations):
+                if not isinstance(evaluation, dict):
+                    continue
+                evaluation = self._constrain_evaluation(evaluation)
+                resp["ai_evaluation"] = evaluation
+                resp["evaluation"] = evaluation
+            logger.debug("Batch evaluated %d responses", len(pending))
+        except Exception as e:
+            logger.warning("Batch evaluation failed, keeping provisional scores: %s", e)
 
     async def generate_final_report(self, session_id: str) -> Dict:
         """Generate comprehensive final interview report with all analytics"""
         
-        if session_id not in session_storage:
-            raise HTTPException(status_code=404, detail="Interview session not found")
-        
-        session = session_storage[session_id]
+        session = get_session(session_id)
         
         if not session.get("responses"):
             return {
@@ -698,36 +1159,60 @@ class VoiceInterviewAPI:
                 "status": "insufficient_data"
             }
         
-        print(f"📊 Generating comprehensive report for {session_id[:8]}...")
-        
+        logger.info("Generating comprehensive report for %s", session_id[:8])
+
+        # Flush any evaluations still waiting on a deferred batch so the
+        # report is computed from final scores, not provisional ones
+        leftover_evals = session.pop("_pending_evals", None)
+        if leftover_evals:
+            await self._batch_evaluate(leftover_evals)
+
         responses = session["responses"]
-        
+
+        # Columnar views for the analyzers below, preferring the mirror
+        # maintained at submission time over a fresh extraction pass
+        columns = self._report_columns(session, responses)
+
         # Calculate comprehensive metrics
-        performance_metrics = self._calculate_performance_metrics(responses)
+        performance_metrics = self._calculate_performance_metrics(columns)
         
         # Advanced analytics if evaluator available
         advanced_analytics = {}
         if self.evaluator and MODULES_STATUS["evaluator"]:
             try:
-                advanced_analytics = self.evaluator.calculate_interview_aggregate_scores(responses)
+                # CPU-heavy aggregation runs in the threadpool so other
+                # interview sessions keep making progress meanwhile
+                advanced_analytics = await asyncio.to_thread(
+                    self.evaluator.calculate_interview_aggregate_scores, responses
+                )
                 insights = self.evaluator.generate_scoring_insights(advanced_analytics)
                 advanced_analytics["insights"] = insights
-                print("✅ Advanced analytics generated")
+                logger.debug("Advanced analytics generated")
             except Exception as e:
-                print(f"⚠️ Advanced analytics failed: {e}")
+                logger.warning("Advanced analytics failed: %s", e)
         
-        # Calculate session duration
+        # Calculate session duration (single clock read, formatted once)
         start_time = session["created_at"]
         end_time = datetime.now()
         duration_minutes = (end_time - start_time).total_seconds() / 60
+        start_fmt = start_time.strftime("%Y-%m-%d %H:%M:%S")
+        end_fmt = end_time.strftime("%Y-%m-%d %H:%M:%S")
+        end_iso = end_time.isoformat()
+
+        # Bind the nested lookups once; the .get(..., {}) chains otherwise
+        # allocate a fresh default dict per access
+        candidate_data = session.get("candidate_data")
+        processing_log = session.get("resume_processing_log") or {}
+        extracted_skills = (candidate_data.get("skills") or [])[:15] if candidate_data else []
+        work_experience = (candidate_data.get("organizations") or [])[:8] if candidate_data else []
         
         # Compile comprehensive report
         comprehensive_report = {
             "session_metadata": {
                 "session_id": session_id,
                 "candidate_name": session["candidate_name"],
-                "interview_date": start_time.strftime("%Y-%m-%d %H:%M:%S"),
-                "completion_time": end_time.strftime("%Y-%m-%d %H:%M:%S"),
+                "interview_date": start_fmt,
+                "completion_time": end_fmt,
                 "duration_minutes": round(duration_minutes, 1),
                 "questions_answered": len(responses),
                 "total_questions_planned": session["total_questions"],
@@ -738,22 +1223,22 @@ class VoiceInterviewAPI:
             "performance_metrics": performance_metrics,
             
             "resume_analysis": {
-                "resume_uploaded": session.get("candidate_data") is not None,
+                "resume_uploaded": candidate_data is not None,
                 "resume_match_score": session.get("resume_match_score", 0),
-                "processing_status": session.get("resume_processing_log", {}).get("processing_status", "no_resume"),
-                "extracted_skills": session.get("candidate_data", {}).get("skills", [])[:15] if session.get("candidate_data") else [],
-                "work_experience": session.get("candidate_data", {}).get("organizations", [])[:8] if session.get("candidate_data") else [],
+                "processing_status": processing_log.get("processing_status", "no_resume"),
+                "extracted_skills": extracted_skills,
+                "work_experience": work_experience,
                 "privacy_compliant": session.get("privacy_compliant", True)
             },
             
             "response_analysis": {
-                "category_breakdown": self._analyze_responses_by_category(responses),
-                "communication_patterns": self._analyze_communication_patterns(responses),
-                "technical_assessment": self._analyze_technical_competence(responses),
-                "behavioral_insights": self._analyze_behavioral_responses(responses)
+                "category_breakdown": self._analyze_responses_by_category(columns),
+                "communication_patterns": self._analyze_communication_patterns(columns),
+                "technical_assessment": self._analyze_technical_competence(columns),
+                "behavioral_insights": self._analyze_behavioral_responses(columns)
             },
-            
-            "qualitative_assessment": self._generate_qualitative_assessment(responses, performance_metrics),
+
+            "qualitative_assessment": self._generate_qualitative_assessment(responses, columns, performance_metrics),
             
             "final_assessment": self._generate_final_assessment(performance_metrics, session),
             
@@ -761,82 +1246,125 @@ class VoiceInterviewAPI:
             
             "system_metadata": {
                 "evaluation_engine": "CampusHire.ai Advanced Analytics",
-                "ai_model": "Google Gemini Pro" if self.ai_available else "Rule-based fallback",
+                "ai_model": "Google Gemini 1.5 Flash" if self.ai_available else "Rule-based fallback",
                 "modules_used": [name for name, available in MODULES_STATUS.items() if available],
                 "privacy_policy": "Structured data only - original files securely deleted",
-                "report_generated_at": datetime.now().isoformat()
-            }
+                "report_generated_at": end_iso
+            },
+
+            # Advanced analytics slot in here when available so the dict is
+            # built once at its final size instead of resized afterwards
+            **({"advanced_analytics": advanced_analytics} if advanced_analytics else {})
         }
-        
-        # Add advanced analytics if available
-        if advanced_analytics:
-            comprehensive_report["advanced_analytics"] = advanced_analytics
-        
+
         # Generate formatted reports if report generator available
         if self.report_generator and MODULES_STATUS["reporter"]:
             try:
-                saved_reports = self.report_generator.save_report(comprehensive_report, "all")
+                # Disk writes go through the threadpool; a large report dump
+                # would otherwise block the event loop
+                saved_reports = await asyncio.to_thread(
+                    self.report_generator.save_report, comprehensive_report, "all"
+                )
                 comprehensive_report["saved_reports"] = saved_reports
-                print(f"✅ Formatted reports saved: {list(saved_reports.keys())}")
+                logger.info("Formatted reports saved: %s", list(saved_reports.keys()))
             except Exception as e:
-                print(f"⚠️ Report generation failed: {e}")
+                logger.warning("Report generation failed: %s", e)
         
-        print(f"🎯 Report generated: {performance_metrics.get('recommendation', 'Under Review')}")
+        logger.info("Report generated: %s", performance_metrics.get('recommendation', 'Under Review'))
         
         return comprehensive_report
 
     # Helper methods for comprehensive analysis
-    
-    def _calculate_performance_metrics(self, responses: List[Dict]) -> Dict:
+
+    @staticmethod
+    def _extract_response_arrays(responses: List[Dict]) -> Dict:
+        """Walk the responses exactly once and build the columnar views the
+        report analyzers read, so no analyzer re-traverses the nested dicts."""
+        n = len(responses)
+        overall = np.empty(n, dtype=np.float32)
+        technical = np.empty(n, dtype=np.float32)
+        communication = np.empty(n, dtype=np.float32)
+        word_counts = np.empty(n, dtype=np.int64)
+        leadership = np.empty(n, dtype=bool)
+        experience = np.empty(n, dtype=bool)
+        categories = []
+        strengths = []
+        improvements = []
+        keywords = []
+
+        for i, response in enumerate(responses):
+            eval_data = response.get("evaluation", {})
+            overall[i] = eval_data.get("overall_score", 5)
+            technical[i] = eval_data.get("technical_depth", 3)
+            communication[i] = eval_data.get("communication_clarity", 3)
+            leadership[i] = bool(eval_data.get("shows_leadership", False))
+            experience[i] = bool(eval_data.get("demonstrates_experience", False))
+            word_counts[i] = response.get("response_analytics", {}).get("word_count", 0)
+            categories.append(response.get("category", "general"))
+            strengths.append(eval_data.get("strengths", ()))
+            improvements.append(eval_data.get("improvements", ()))
+            keywords.append(eval_data.get("technical_keywords_used", ()))
+
+        return {
+            "overall": overall,
+            "technical": technical,
+            "communication": communication,
+            "word_counts": word_counts,
+            "leadership": leadership,
+            "experience": experience,
+            "categories": categories,
+            "strengths": strengths,
+            "improvements": improvements,
+            "keywords": keywords,
+        }
+
+    def _report_columns(self, session: Dict, responses: List[Dict]) -> Dict:
+        """Columnar arrays for report analytics.
+
+        Uses the mirror appended to on every submission when it covers all
+        responses; otherwise (older sessions, deferred evaluation) falls back
+        to extracting the columns from the response dicts.
+        """
+        stored = session.get("response_columns")
+        if stored is None or len(stored["overall"]) != len(responses):
+            return self._extract_response_arrays(responses)
+        return {
+            "overall": np.asarray(stored["overall"], dtype=np.float32),
+            "technical": np.asarray(stored["technical"], dtype=np.float32),
+            "communication": np.asarray(stored["communication"], dtype=np.float32),
+            "word_counts": np.asarray(stored["word_counts"], dtype=np.int64),
+            "leadership": np.asarray(stored["leadership"], dtype=bool),
+            "experience": np.asarray(stored["experience"], dtype=bool),
+            "categories": stored["categories"],
+            "strengths": stored["strengths"],
+            "improvements": stored["improvements"],
+            "keywords": stored["keywords"],
+        }
+
+    def _calculate_performance_metrics(self, columns: Dict) -> Dict:
         """Calculate comprehensive performance metrics"""
-        
-        if not responses:
+
+        overall = columns["overall"]
+        if not overall.size:
             return {"error": "No responses to analyze"}
-        
-        # Extract scores
-        overall_scores = []
-        technical_scores = []
-        communication_scores = []
-        
-        for response in responses:
-            eval_data = response.get("evaluation", {})
-            overall_scores.append(eval_data.get("overall_score", 5))
-            technical_scores.append(eval_data.get("technical_depth", 3))
-            communication_scores.append(eval_data.get("communication_clarity", 3))
-        
-        # Calculate averages and statistics
-        avg_overall = sum(overall_scores) / len(overall_scores)
-        avg_technical = sum(technical_scores) / len(technical_scores)
-        avg_communication = sum(communication_scores) / len(communication_scores)
-        
-        # Score distribution
-        excellent_responses = len([s for s in overall_scores if s >= 8])
-        good_responses = len([s for s in overall_scores if 6 <= s < 8])
-        average_responses = len([s for s in overall_scores if 4 <= s < 6])
-        weak_responses = len([s for s in overall_scores if s < 4])
+
+        avg_overall = float(overall.mean())
+        avg_technical = float(columns["technical"].mean())
+        avg_communication = float(columns["communication"].mean())
+
+        # Score distribution: one digitize pass bins every score at once
+        weak_responses, average_responses, good_responses, excellent_responses = (
+            int(c) for c in np.bincount(np.digitize(overall, (4, 6, 8)), minlength=4)
+        )
         
         # Determine recommendation
-        if avg_overall >= 8:
-            recommendation = "Strong Hire"
-            confidence = "High"
-        elif avg_overall >= 7:
-            recommendation = "Hire"
-            confidence = "High"
-        elif avg_overall >= 6:
-            recommendation = "Hire"
-            confidence = "Medium"
-        elif avg_overall >= 5:
-            recommendation = "Maybe"
-            confidence = "Medium"
-        else:
-            recommendation = "Pass"
-            confidence = "High"
+        recommendation, confidence = _REC_VALUES[bisect_right(_REC_THRESHOLDS, avg_overall)]
         
         return {
             "overall_score": round(avg_overall, 1),
             "technical_competency": round(avg_technical, 1),
             "communication_skills": round(avg_communication, 1),
-            "consistency_score": round(1 - (max(overall_scores) - min(overall_scores)) / 10, 2),
+            "consistency_score": round(1 - float(overall.ptp()) / 10, 2),
             "score_distribution": {
                 "excellent_responses": excellent_responses,
                 "good_responses": good_responses,
@@ -848,104 +1376,87 @@ class VoiceInterviewAPI:
             "hire_probability": round(min(100, max(0, (avg_overall - 3) * 20)), 1)
         }
     
-    def _analyze_responses_by_category(self, responses: List[Dict]) -> Dict:
+    def _analyze_responses_by_category(self, columns: Dict) -> Dict:
         """Analyze performance by question category"""
-        
-        category_analysis = {}
-        
-        for response in responses:
-            category = response.get("category", "general")
-            score = response.get("evaluation", {}).get("overall_score", 5)
-            
-            if category not in category_analysis:
-                category_analysis[category] = {"scores": [], "count": 0}
-            
-            category_analysis[category]["scores"].append(score)
-            category_analysis[category]["count"] += 1
-        
-        # Calculate averages per category
-        for category, data in category_analysis.items():
-            data["average_score"] = sum(data["scores"]) / len(data["scores"])
-            data["performance_level"] = (
-                "Excellent" if data["average_score"] >= 8 else
-                "Good" if data["average_score"] >= 6 else
-                "Average" if data["average_score"] >= 4 else
-                "Needs Improvement"
-            )
-        
-        return category_analysis
+
+        scores_by_category = defaultdict(list)
+        for category, score in zip(columns["categories"], columns["overall"]):
+            scores_by_category[category].append(float(score))
+
+        return {
+            category: {
+                "scores": scores,
+                "count": len(scores),
+                "average_score": (average := sum(scores) / len(scores)),
+                "performance_level": _SCORE_LEVELS[bisect_right(_SCORE_LEVEL_THRESHOLDS, average)]
+            }
+            for category, scores in scores_by_category.items()
+        }
     
-    def _analyze_communication_patterns(self, responses: List[Dict]) -> Dict:
+    def _analyze_communication_patterns(self, columns: Dict) -> Dict:
         """Analyze communication patterns and style"""
-        
-        total_words = 0
-        total_responses = len(responses)
-        response_lengths = []
-        
-        for response in responses:
-            word_count = response.get("response_analytics", {}).get("word_count", 0)
-            total_words += word_count
-            response_lengths.append(word_count)
-        
-        avg_response_length = total_words / max(total_responses, 1)
-        
+
+        word_counts = columns["word_counts"]
+        total_words = int(word_counts.sum())
+        avg_response_length = total_words / max(word_counts.size, 1)
+
         return {
             "average_response_length": round(avg_response_length, 1),
             "total_words": total_words,
-            "response_consistency": round(1 - (max(response_lengths) - min(response_lengths)) / max(max(response_lengths), 1), 2),
-            "communication_style": (
-                "Detailed and thorough" if avg_response_length > 80 else
-                "Balanced and clear" if avg_response_length > 40 else
-                "Concise" if avg_response_length > 20 else
-                "Brief responses"
-            )
+            "response_consistency": round(1 - int(word_counts.ptp()) / max(int(word_counts.max()), 1), 2),
+            "communication_style": _COMM_STYLES[bisect_left(_COMM_STYLE_THRESHOLDS, avg_response_length)]
         }
     
-    def _analyze_technical_competence(self, responses: List[Dict]) -> Dict:
+    def _analyze_technical_competence(self, columns: Dict) -> Dict:
         """Analyze technical competence across responses"""
-        
-        technical_responses = [r for r in responses if r.get("category") == "technical"]
-        
-        if not technical_responses:
+
+        categories = columns["categories"]
+        tech_mask = np.fromiter(
+            (category == "technical" for category in categories),
+            dtype=bool,
+            count=len(categories)
+        )
+        technical_count = int(tech_mask.sum())
+
+        if not technical_count:
             return {"technical_questions_answered": 0, "assessment": "No technical questions answered"}
-        
-        technical_scores = [r.get("evaluation", {}).get("technical_depth", 3) for r in technical_responses]
-        avg_technical_depth = sum(technical_scores) / len(technical_scores)
-        
-        # Count technical keywords mentioned
-        all_keywords = []
-        for response in technical_responses:
-            keywords = response.get("evaluation", {}).get("technical_keywords_used", [])
-            all_keywords.extend(keywords)
-        
+
+        avg_technical_depth = float(columns["technical"][tech_mask].mean())
+
+        # Unique technical keywords mentioned, without an intermediate list
+        unique_keywords = {
+            keyword
+            for response_keywords, is_technical in zip(columns["keywords"], tech_mask)
+            if is_technical
+            for keyword in response_keywords
+        }
+
         return {
-            "technical_questions_answered": len(technical_responses),
+            "technical_questions_answered": technical_count,
             "average_technical_depth": round(avg_technical_depth, 1),
-            "technical_keywords_mentioned": len(set(all_keywords)),
-            "technical_competency_level": (
-                "Expert" if avg_technical_depth >= 4.5 else
-                "Advanced" if avg_technical_depth >= 3.5 else
-                "Intermediate" if avg_technical_depth >= 2.5 else
-                "Beginner"
-            )
+            "technical_keywords_mentioned": len(unique_keywords),
+            "technical_competency_level": _TECH_LEVELS[bisect_right(_TECH_LEVEL_THRESHOLDS, avg_technical_depth)]
         }
     
-    def _analyze_behavioral_responses(self, responses: List[Dict]) -> Dict:
+    def _analyze_behavioral_responses(self, columns: Dict) -> Dict:
         """Analyze behavioral and soft skills"""
-        
-        behavioral_responses = [r for r in responses if r.get("category") in ["behavioral", "role_specific"]]
-        
-        if not behavioral_responses:
+
+        categories = columns["categories"]
+        behavioral_mask = np.fromiter(
+            (category in ("behavioral", "role_specific") for category in categories),
+            dtype=bool,
+            count=len(categories)
+        )
+        behavioral_count = int(behavioral_mask.sum())
+
+        if not behavioral_count:
             return {"behavioral_assessment": "Limited behavioral data"}
-        
-        shows_leadership = sum(1 for r in behavioral_responses 
-                             if r.get("evaluation", {}).get("shows_leadership", False))
-        
-        demonstrates_experience = sum(1 for r in behavioral_responses 
-                                    if r.get("evaluation", {}).get("demonstrates_experience", False))
-        
+
+        shows_leadership = int(columns["leadership"][behavioral_mask].sum())
+        demonstrates_experience = int(columns["experience"][behavioral_mask].sum())
+
         return {
-            "behavioral_responses": len(behavioral_responses),
+            "behavioral_responses": behavioral_count,
             "leadership_indicators": shows_leadership,
             "experience_demonstrated": demonstrates_experience,
             "soft_skills_assessment": (
@@ -955,31 +1466,24 @@ class VoiceInterviewAPI:
             )
         }
     
-    def _generate_qualitative_assessment(self, responses: List[Dict], performance_metrics: Dict) -> Dict:
+    def _generate_qualitative_assessment(self, responses: List[Dict], columns: Dict,
+                                         performance_metrics: Dict) -> Dict:
         """Generate qualitative assessment summary"""
-        
-        # Collect all strengths and improvements
-        all_strengths = []
-        all_improvements = []
-        
-        for response in responses:
-            eval_data = response.get("evaluation", {})
-            all_strengths.extend(eval_data.get("strengths", []))
-            all_improvements.extend(eval_data.get("improvements", []))
-        
-        # Get unique top items
-        top_strengths = list(dict.fromkeys(all_strengths))[:5]
-        key_improvements = list(dict.fromkeys(all_improvements))[:3]
-        
+
+        # Unique top items, stopping the scan once enough are collected
+        # instead of deduplicating every strength before slicing
+        top_strengths = _first_unique(chain.from_iterable(columns["strengths"]), 5)
+        key_improvements = _first_unique(chain.from_iterable(columns["improvements"]), 3)
+
         # Find standout responses
         standout_responses = [
             {
                 "question_number": r["question_number"],
                 "category": r["category"],
-                "score": r["evaluation"]["overall_score"],
+                "score": float(score),
                 "highlight": r["question"][:100] + "..."
             }
-            for r in responses if r.get("evaluation", {}).get("overall_score", 0) >= 8
+            for r, score in zip(responses, columns["overall"]) if score >= 8
         ][:3]
         
         return {
@@ -991,20 +1495,12 @@ class VoiceInterviewAPI:
     
     def _generate_overall_impression(self, performance_metrics: Dict) -> str:
         """Generate overall impression summary"""
-        
+
         score = performance_metrics.get("overall_score", 5)
         consistency = performance_metrics.get("consistency_score", 0.5)
-        
-        if score >= 8 and consistency >= 0.8:
-            return "Exceptional candidate with consistently high performance across all areas. Demonstrates strong technical skills and excellent communication."
-        elif score >= 7 and consistency >= 0.7:
-            return "Strong candidate with solid performance. Shows good technical competency and effective communication skills."
-        elif score >= 6:
-            return "Competent candidate with decent performance. Has potential but may need some development in key areas."
-        elif score >= 4:
-            return "Average candidate with mixed performance. Shows some promise but requires significant development."
-        else:
-            return "Candidate performance below expectations. Would need substantial development to meet role requirements."
+
+        # Quantize to bound the cache key space (~100x100 entries)
+        return _impression_for(round(score, 1), round(consistency, 2))
     
     def _generate_final_assessment(self, performance_metrics: Dict, session: Dict) -> Dict:
         """Generate final hiring assessment and recommendations"""
@@ -1054,17 +1550,7 @@ class VoiceInterviewAPI:
     
     def _suggest_salary_band(self, overall_score: float) -> str:
         """Suggest salary band based on performance"""
-        
-        if overall_score >= 8.5:
-            return "Top of band - exceptional candidate"
-        elif overall_score >= 7.5:
-            return "Upper band - strong performer"
-        elif overall_score >= 6.5:
-            return "Mid band - solid contributor"
-        elif overall_score >= 5.5:
-            return "Lower-mid band - growth potential"
-        else:
-            return "Entry level - requires development"
+        return _salary_band_for(round(overall_score, 1))
     
     def _suggest_onboarding_focus(self, performance_metrics: Dict) -> List[str]:
         """Suggest onboarding focus areas"""
@@ -26,7 +26,17 @@ class Settings(BaseSettings):
     
     # API
     API_V1_STR: str = "/api/v1"
-    BACKEND_CORS_ORIGINS: str = os.getenv("BACKEND_CORS_ORIGINS", "*")
+    # Comma-separated list of allowed origins; wildcard origins defeat CORS
+    # caching and add preflight overhead, so default to the known frontends
+    BACKEND_CORS_ORIGINS: str = os.getenv(
+        "BACKEND_CORS_ORIGINS",
+        "http://localhost:8501,http://localhost:3000"
+    )
+
+    @property
+    def cors_origins(self) -> list[str]:
+        """Allowed CORS origins as a list."""
+        return [origin.strip() for origin in self.BACKEND_CORS_ORIGINS.split(",") if origin.strip()]
     
     # File Uploads
     UPLOAD_FOLDER: str = str(Path(__file__).parent.parent / "uploads")
@@ -1,23 +1,115 @@
-﻿from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+﻿import os
+
+import torch
+from sentence_transformers import SentenceTransformer
 import numpy as np
 
+# CPU inference tuning: torch can default to a single intra-op thread in
+# containerized deployments, and encoding never needs gradients
+try:
+    torch.set_num_threads(int(os.getenv("SBERT_THREADS", str(os.cpu_count() or 4))))
+    torch.set_num_interop_threads(1)
+except RuntimeError:
+    # Thread pools already initialized (module re-import); keep them
+    pass
+
 semantic_model = SentenceTransformer('all-MiniLM-L6-v2')
+semantic_model.eval()
+
+# Rough char->token ratio cap: anything past this exceeds the encoder's
+# sequence limit anyway, so trimming avoids tokenizing text that would be
+# discarded
+_PROFILE_MAX_CHARS = 512 * 4
 
 def create_resume_profile(resume_data: dict) -> str:
-    skills = " ".join(resume_data.get("skills", []))
-    orgs = " ".join(resume_data.get("organizations", []))
+    # Comma separators keep the tokenizer producing one piece per skill;
+    # run-together words split into junk subwords and inflate the sequence
+    skills = ", ".join(resume_data.get("skills", []))
+    orgs = ", ".join(resume_data.get("organizations", []))
     profile = f"Skills: {skills}. Experience at: {orgs}."
-    return profile
+    return profile[:_PROFILE_MAX_CHARS]
+
+def calculate_match_scores(resume_profiles: list, job_descriptions: list) -> np.ndarray:
+    """Score every resume profile against every job description.
+
+    All texts go through one encode call so the model batches them together
+    (length-sorted, minimally padded) instead of one forward pass per text.
+    The embeddings come back unit-normalized, so a single matrix product
+    yields the full cosine-similarity grid.
+
+    Returns an array of shape (len(resume_profiles), len(job_descriptions))
+    with scores in percent.
+    """
+    texts = list(resume_profiles) + list(job_descriptions)
+    with torch.inference_mode():
+        embeddings = semantic_model.encode(
+            texts,
+            batch_size=64,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+    profile_embeddings = embeddings[:len(resume_profiles)]
+    job_embeddings = embeddings[len(resume_profiles):]
+    return profile_embeddings @ job_embeddings.T * 100
+
+def score_matrix(resumes: list, job_descriptions: list) -> np.ndarray:
+    """Score N parsed resumes against M job descriptions in one shot.
+
+    Builds the profile strings and delegates to calculate_match_scores, so
+    everything is encoded in one batched call and the full NxM grid comes
+    from a single matrix product instead of N*M per-pair encodes.
+    """
+    profiles = [create_resume_profile(resume) for resume in resumes]
+    return calculate_match_scores(profiles, job_descriptions)
+
+class JobFamily:
+    """Centroid index over a cohort of related job descriptions.
+
+    Mean cosine similarity against a set of unit embeddings reduces to one
+    dot product with the re-normalized mean embedding, so scoring a resume
+    against the whole family ("fit to all ML roles") costs the same as
+    scoring it against a single description, and the family stores one
+    384-dim vector regardless of how many descriptions it covers.
+    """
+
+    def __init__(self, job_descriptions: list):
+        with torch.inference_mode():
+            embeddings = semantic_model.encode(
+                list(job_descriptions),
+                batch_size=64,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
+        centroid = embeddings.mean(axis=0)
+        self.centroid = centroid / np.linalg.norm(centroid)
+
+    def score(self, resume_profile: str) -> float:
+        """Average fit of one resume profile to the family, in percent."""
+        return float(_encode_normed(resume_profile) @ self.centroid) * 100
+
+# Normalized job-description embeddings cached by text: one description is
+# scored against many candidates, so caching drops per-candidate work to a
+# single resume encode plus a dot product. Bounded, oldest evicted first.
+_jd_cache: dict = {}
+_JD_CACHE_MAX = 256
+
+def _encode_normed(text: str) -> np.ndarray:
+    """Encode one text and return its unit-normalized embedding."""
+    with torch.inference_mode():
+        embedding = semantic_model.encode(text, convert_to_numpy=True)
+    return embedding / np.linalg.norm(embedding)
 
 def calculate_match_score(resume_profile: str, job_description: str) -> float:
     """Calculate cosine similarity between resume and job description."""
-    profile_embeddings = semantic_model.encode(resume_profile, convert_to_tensor=True)
-    job_embeddings = semantic_model.encode(job_description, convert_to_tensor=True)
-    profile_embeddings = profile_embeddings.reshape(1, -1)
-    job_embeddings = job_embeddings.reshape(1, -1)
-    similarity = cosine_similarity(profile_embeddings, job_embeddings)[0][0]
-    return float(similarity * 100)
+    jd_embedding = _jd_cache.get(job_description)
+    if jd_embedding is None:
+        if len(_jd_cache) >= _JD_CACHE_MAX:
+            _jd_cache.pop(next(iter(_jd_cache)))
+        jd_embedding = _jd_cache[job_description] = _encode_normed(job_description)
+    # Both vectors are unit norm, so the dot product is the cosine
+    return float(_encode_normed(resume_profile) @ jd_embedding) * 100
 
 if __name__ == '__main__':
     sample_resume_data = {
@@ -1,4 +1,4 @@
-import json
+import orjson
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -113,16 +113,20 @@ class InterviewReportGenerator:
         if format_type in ["all", "json"]:
             # Raw Data (JSON)
             json_path = self.output_dir / f"interview_data_{session_id}_{timestamp}.json"
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, indent=2, default=str, ensure_ascii=False)
+            with open(json_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    report_data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
             saved_files["raw_data"] = str(json_path)
         
         if format_type in ["all", "dashboard"]:
             # HR Dashboard Data (JSON)
             dashboard_data = self.generate_hr_dashboard_data(report_data)
             dashboard_path = self.output_dir / f"dashboard_data_{session_id}_{timestamp}.json"
-            with open(dashboard_path, 'w', encoding='utf-8') as f:
-                json.dump(dashboard_data, f, indent=2, ensure_ascii=False)
+            with open(dashboard_path, 'wb') as f:
+                f.write(orjson.dumps(dashboard_data, option=orjson.OPT_INDENT_2))
             saved_files["dashboard_data"] = str(dashboard_path)
         
         return saved_files
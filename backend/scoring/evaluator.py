@@ -3,17 +3,53 @@ CampusHire.ai Response Evaluator
 Advanced scoring and evaluation algorithms for interview responses
 """
 
+import asyncio
 import re
 import math
+import numpy as np
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from statistics import fmean, median
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import sys
+import time
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
+# Compiled once: splitting on sentence punctuation runs per response, and
+# going through re.split pays the pattern-cache lookup every time
+_SENTENCE_RE = re.compile(r'[.!?]+')
+
+# Bit flags packing the four quality booleans into one small int, so
+# aggregation can mask a flag array instead of digging four dict keys per
+# response. The boolean keys stay in the dicts for API compatibility.
+FLAG_EXAMPLES = 1
+FLAG_METRICS = 2
+FLAG_LEADERSHIP = 4
+FLAG_PROBLEM_SOLVING = 8
+
+@lru_cache(maxsize=1)
+def _iso_from_epoch(epoch_s: int) -> str:
+    """Format an epoch second as ISO once; repeat calls within the same
+    second reuse the cached string instead of allocating a new datetime."""
+    return datetime.fromtimestamp(epoch_s).isoformat()
+
+def _quality_flags(eval_data: Dict) -> int:
+    """Read the packed flags, reconstructing them for older evaluations."""
+    flags = eval_data.get("quality_flags")
+    if flags is None:
+        flags = (
+            (FLAG_EXAMPLES if eval_data.get("has_specific_examples", False) else 0)
+            | (FLAG_LEADERSHIP if eval_data.get("shows_leadership", False) else 0)
+        )
+    return flags
+
 class InterviewEvaluator:
     """
     Advanced evaluation system for interview responses
@@ -60,21 +96,46 @@ class InterviewEvaluator:
                 "identified", "analyzed", "troubleshot", "implemented solution"
             ]
         }
-    
+
+        # One compiled lookahead alternation per keyword group: a single
+        # C-level scan per group finds every keyword present (including
+        # overlapping hits), replacing one Python substring test per keyword
+        # per analyzer. Longest-first ordering makes multi-word phrases win
+        # over their prefixes at the same start position.
+        self._keyword_scanners = {
+            group: re.compile(
+                r'(?=(' + '|'.join(map(re.escape, sorted(words, key=len, reverse=True))) + r'))'
+            )
+            for group, words in {**self.technical_keywords, **self.quality_indicators}.items()
+        }
+        self._total_technical_keywords = sum(len(words) for words in self.technical_keywords.values())
+
+    def _scan_keywords(self, response_lower: str) -> Dict[str, set]:
+        """Collect every known keyword present in the response, per group."""
+        return {
+            group: set(pattern.findall(response_lower))
+            for group, pattern in self._keyword_scanners.items()
+        }
+
     def evaluate_response_comprehensively(self, question: str, response: str, 
                                         category: str, ai_evaluation: Dict) -> Dict:
         """
         Combine AI evaluation with rule-based analysis for comprehensive scoring
         """
         
+        # Lowercase, tokenize and keyword-scan exactly once; the analyzers
+        # all work from these shared views instead of re-deriving them
+        words = response.split()
+        keyword_hits = self._scan_keywords(response.lower())
+
         # Get rule-based metrics
-        rule_based_scores = self._calculate_rule_based_scores(response, category)
-        
+        rule_based_scores = self._calculate_rule_based_scores(len(words), keyword_hits)
+
         # Analyze response quality
-        quality_metrics = self._analyze_response_quality(response)
-        
+        quality_metrics = self._analyze_response_quality(response, words, keyword_hits)
+
         # Calculate technical depth
-        technical_depth = self._assess_technical_depth(response, category)
+        technical_depth = self._assess_technical_depth(keyword_hits)
         
         # Determine consistency with AI evaluation
         consistency_check = self._check_consistency(ai_evaluation, rule_based_scores)
@@ -106,6 +167,7 @@ class InterviewEvaluator:
             "final_communication": ai_evaluation.get("communication_clarity", 3),
             
             # Quality flags
+            "quality_flags": quality_metrics["quality_flags"],
             "has_specific_examples": quality_metrics["has_examples"],
             "mentions_metrics": quality_metrics["has_metrics"],
             "shows_leadership": quality_metrics["shows_leadership"],
@@ -115,11 +177,32 @@ class InterviewEvaluator:
             "consistency_score": consistency_check["consistency"],
             "evaluation_confidence": consistency_check["confidence"],
             "category": category,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _iso_from_epoch(int(time.time()))
         }
         
         return comprehensive_eval
-    
+
+    def evaluate_responses(self, items: List[Tuple[str, str, str, Dict]]) -> List[Dict]:
+        """Evaluate many (question, response, category, ai_evaluation)
+        tuples concurrently.
+
+        Each evaluation is independent and the heavy lifting (regex scans,
+        NumPy reductions) runs in C code that releases the GIL, so a thread
+        pool gives real parallelism without pickling anything. Results come
+        back in input order.
+        """
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(
+                lambda item: self.evaluate_response_comprehensively(*item), items
+            ))
+
+    async def aevaluate_responses(self, items: List[Tuple[str, str, str, Dict]]) -> List[Dict]:
+        """Async variant of evaluate_responses for event-loop callers."""
+        return await asyncio.gather(*(
+            asyncio.to_thread(self.evaluate_response_comprehensively, *item)
+            for item in items
+        ))
+
     def calculate_interview_aggregate_scores(self, all_responses: List[Dict]) -> Dict:
         """
         Calculate aggregate performance metrics across all interview responses
@@ -132,41 +215,55 @@ class InterviewEvaluator:
         overall_scores = []
         technical_scores = []
         communication_scores = []
-        category_performance = {}
-        
+        category_performance = defaultdict(list)
+
         for response in all_responses:
             eval_data = response.get("evaluation", {})
-            
+
             # Collect scores
             overall_scores.append(eval_data.get("final_overall_score", eval_data.get("overall_score", 5)))
             technical_scores.append(eval_data.get("final_technical_depth", eval_data.get("technical_depth", 3)))
             communication_scores.append(eval_data.get("final_communication", eval_data.get("communication_clarity", 3)))
-            
+
             # Category-wise performance
-            category = response.get("category", "general")
-            if category not in category_performance:
-                category_performance[category] = []
-            category_performance[category].append(eval_data.get("overall_score", 5))
+            category_performance[response.get("category", "general")].append(eval_data.get("overall_score", 5))
         
+        # One conversion to arrays so every statistic below runs in C
+        # instead of a Python-level loop per metric
+        overall = np.asarray(overall_scores, dtype=np.float64)
+        technical = np.asarray(technical_scores, dtype=np.float64)
+        communication = np.asarray(communication_scores, dtype=np.float64)
+
+        # Raw per-response evaluation scores, shared by the red-flag and
+        # standout checks so neither rebuilds it
+        eval_scores = np.fromiter(
+            (r.get("evaluation", {}).get("overall_score", 5) for r in all_responses),
+            dtype=np.float64, count=len(all_responses)
+        )
+        quality_flags = np.fromiter(
+            (_quality_flags(r.get("evaluation", {})) for r in all_responses),
+            dtype=np.uint8, count=len(all_responses)
+        )
+
         # Calculate statistics
         aggregate_scores = {
             "overall_statistics": {
-                "mean": self._safe_mean(overall_scores),
-                "median": self._safe_median(overall_scores),
-                "std_deviation": self._safe_std(overall_scores),
-                "min_score": min(overall_scores) if overall_scores else 0,
-                "max_score": max(overall_scores) if overall_scores else 0,
-                "score_range": max(overall_scores) - min(overall_scores) if overall_scores else 0
+                "mean": float(overall.mean()),
+                "median": float(np.median(overall)),
+                "std_deviation": float(overall.std()),
+                "min_score": float(overall.min()),
+                "max_score": float(overall.max()),
+                "score_range": float(overall.ptp())
             },
-            
+
             "technical_statistics": {
-                "mean": self._safe_mean(technical_scores),
-                "consistency": 1 - (self._safe_std(technical_scores) / 5) if technical_scores else 0
+                "mean": float(technical.mean()),
+                "consistency": 1 - float(technical.std()) / 5
             },
-            
+
             "communication_statistics": {
-                "mean": self._safe_mean(communication_scores),
-                "consistency": 1 - (self._safe_std(communication_scores) / 5) if communication_scores else 0
+                "mean": float(communication.mean()),
+                "consistency": 1 - float(communication.std()) / 5
             },
             
             "category_performance": {
@@ -178,15 +275,15 @@ class InterviewEvaluator:
                 for category, scores in category_performance.items()
             },
             
-            "improvement_trend": self._calculate_improvement_trend(overall_scores),
-            
-            "performance_consistency": self._calculate_consistency_rating(overall_scores),
-            
-            "red_flags": self._identify_red_flags(all_responses),
+            "improvement_trend": self._calculate_improvement_trend(overall),
+
+            "performance_consistency": self._calculate_consistency_rating(overall),
             
-            "standout_indicators": self._identify_standout_indicators(all_responses)
+            "red_flags": self._identify_red_flags(all_responses, eval_scores, quality_flags),
+
+            "standout_indicators": self._identify_standout_indicators(all_responses, eval_scores, quality_flags)
         }
-        
+
         return aggregate_scores
     
     def generate_scoring_insights(self, aggregate_scores: Dict) -> Dict:
@@ -233,34 +330,18 @@ class InterviewEvaluator:
     
     # Private helper methods
     
-    def _calculate_rule_based_scores(self, response: str, category: str) -> Dict:
+    def _calculate_rule_based_scores(self, word_count: int, keyword_hits: Dict) -> Dict:
         """Calculate scores based on rule-based analysis"""
-        
-        response_lower = response.lower()
-        
+
         # Technical keyword scoring
-        technical_score = 0
-        total_keywords = 0
-        
-        for domain, keywords in self.technical_keywords.items():
-            for keyword in keywords:
-                if keyword in response_lower:
-                    technical_score += 1
-                total_keywords += 1
-        
-        technical_score = min(5, (technical_score / max(total_keywords, 1)) * 10)
-        
+        technical_score = sum(len(keyword_hits[domain]) for domain in self.technical_keywords)
+        technical_score = min(5, (technical_score / max(self._total_technical_keywords, 1)) * 10)
+
         # Quality indicator scoring
-        quality_score = 0
-        for indicator_type, indicators in self.quality_indicators.items():
-            for indicator in indicators:
-                if indicator in response_lower:
-                    quality_score += 1
-        
+        quality_score = sum(len(keyword_hits[group]) for group in self.quality_indicators)
         quality_score = min(5, quality_score)
-        
+
         # Length and structure scoring
-        word_count = len(response.split())
         length_score = min(5, max(1, (word_count - 20) / 40 * 4 + 1))
         
         # Calculate overall rule-based score
@@ -273,38 +354,42 @@ class InterviewEvaluator:
             "length_score": length_score
         }
     
-    def _analyze_response_quality(self, response: str) -> Dict:
+    def _analyze_response_quality(self, response: str, words: List[str], keyword_hits: Dict) -> Dict:
         """Analyze qualitative aspects of the response"""
-        
-        words = response.split()
-        sentences = re.split(r'[.!?]+', response)
+
+        sentences = _SENTENCE_RE.split(response)
+        flags = (
+            (FLAG_EXAMPLES if keyword_hits["examples"] else 0)
+            | (FLAG_METRICS if keyword_hits["metrics"] else 0)
+            | (FLAG_LEADERSHIP if keyword_hits["leadership"] else 0)
+            | (FLAG_PROBLEM_SOLVING if keyword_hits["problem_solving"] else 0)
+        )
         unique_words = set(word.lower().strip('.,!?;:') for word in words)
-        
-        response_lower = response.lower()
-        
+
         return {
             "word_count": len(words),
             "sentence_count": len([s for s in sentences if s.strip()]),
             "avg_sentence_length": len(words) / max(1, len([s for s in sentences if s.strip()])),
             "unique_word_ratio": len(unique_words) / max(1, len(words)),
-            "has_examples": any(indicator in response_lower for indicator in self.quality_indicators["examples"]),
-            "has_metrics": any(indicator in response_lower for indicator in self.quality_indicators["metrics"]),
-            "shows_leadership": any(indicator in response_lower for indicator in self.quality_indicators["leadership"]),
-            "shows_problem_solving": any(indicator in response_lower for indicator in self.quality_indicators["problem_solving"])
+            "quality_flags": flags,
+            "has_examples": bool(flags & FLAG_EXAMPLES),
+            "has_metrics": bool(flags & FLAG_METRICS),
+            "shows_leadership": bool(flags & FLAG_LEADERSHIP),
+            "shows_problem_solving": bool(flags & FLAG_PROBLEM_SOLVING)
         }
-    
-    def _assess_technical_depth(self, response: str, category: str) -> Dict:
+
+    def _assess_technical_depth(self, keyword_hits: Dict) -> Dict:
         """Assess technical depth and domain relevance"""
-        
-        response_lower = response.lower()
+
         keywords_found = []
         domain_scores = {}
-        
+
         for domain, keywords in self.technical_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in response_lower)
-            domain_scores[domain] = score
-            if score > 0:
-                keywords_found.extend([kw for kw in keywords if kw in response_lower])
+            hits = keyword_hits[domain]
+            domain_scores[domain] = len(hits)
+            if hits:
+                # Filter through the original list to keep output order stable
+                keywords_found.extend(kw for kw in keywords if kw in hits)
         
         # Determine most relevant domain
         best_domain = max(domain_scores.items(), key=lambda x: x[1]) if domain_scores else ("general", 0)
@@ -349,15 +434,11 @@ class InterviewEvaluator:
     
     def _safe_mean(self, values: List[float]) -> float:
         """Calculate mean safely"""
-        return sum(values) / len(values) if values else 0
-    
+        return fmean(values) if values else 0
+
     def _safe_median(self, values: List[float]) -> float:
         """Calculate median safely"""
-        if not values:
-            return 0
-        sorted_values = sorted(values)
-        n = len(sorted_values)
-        return sorted_values[n//2] if n % 2 == 1 else (sorted_values[n//2-1] + sorted_values[n//2]) / 2
+        return median(values) if values else 0
     
     def _safe_std(self, values: List[float]) -> float:
         """Calculate standard deviation safely"""
@@ -378,16 +459,14 @@ class InterviewEvaluator:
         else:
             return "below_average"
     
-    def _calculate_improvement_trend(self, scores: List[float]) -> str:
+    def _calculate_improvement_trend(self, scores: np.ndarray) -> str:
         """Calculate if candidate improved during interview"""
-        if len(scores) < 3:
+        if scores.size < 3:
             return "insufficient_data"
-        
-        first_half = scores[:len(scores)//2]
-        second_half = scores[len(scores)//2:]
-        
-        first_avg = self._safe_mean(first_half)
-        second_avg = self._safe_mean(second_half)
+
+        half = scores.size // 2
+        first_avg = float(scores[:half].mean())
+        second_avg = float(scores[half:].mean())
         
         if second_avg > first_avg + 0.5:
             return "improving"
@@ -396,61 +475,66 @@ class InterviewEvaluator:
         else:
             return "stable"
     
-    def _calculate_consistency_rating(self, scores: List[float]) -> float:
+    def _calculate_consistency_rating(self, scores: np.ndarray) -> float:
         """Calculate consistency rating (0-1)"""
-        if len(scores) < 2:
+        if scores.size < 2:
             return 1.0
-        
-        std_dev = self._safe_std(scores)
+
+        std_dev = float(scores.std())
         max_possible_std = 4.5  # Theoretical max std dev for scores 1-10
         
         return max(0, 1 - (std_dev / max_possible_std))
     
-    def _identify_red_flags(self, responses: List[Dict]) -> List[str]:
+    def _identify_red_flags(self, responses: List[Dict], eval_scores: np.ndarray,
+                            quality_flags: np.ndarray) -> List[str]:
         """Identify potential red flags in responses"""
-        
+
         red_flags = []
-        
+        count = len(responses)
+
         # Check for very short responses
-        short_responses = sum(1 for r in responses if len(r.get("response_text", "").split()) < 15)
-        if short_responses >= len(responses) * 0.4:  # 40% or more short responses
+        word_counts = np.fromiter(
+            (len(r.get("response_text", "").split()) for r in responses),
+            dtype=np.int32, count=count
+        )
+        if int((word_counts < 15).sum()) >= count * 0.4:  # 40% or more short responses
             red_flags.append("Multiple very brief responses - may indicate lack of depth")
-        
+
         # Check for consistently low scores
-        low_scores = sum(1 for r in responses if r.get("evaluation", {}).get("overall_score", 5) < 4)
-        if low_scores >= len(responses) * 0.5:  # 50% or more low scores
+        if int((eval_scores < 4).sum()) >= count * 0.5:  # 50% or more low scores
             red_flags.append("Consistently low performance across multiple areas")
-        
+
         # Check for lack of examples
-        no_examples = sum(1 for r in responses 
-                         if not r.get("evaluation", {}).get("has_specific_examples", False))
-        if no_examples >= len(responses) * 0.7:  # 70% or more without examples
+        no_examples = count - int(np.count_nonzero(quality_flags & FLAG_EXAMPLES))
+        if no_examples >= count * 0.7:  # 70% or more without examples
             red_flags.append("Lack of specific examples or concrete experience")
-        
+
         return red_flags
-    
-    def _identify_standout_indicators(self, responses: List[Dict]) -> List[str]:
+
+    def _identify_standout_indicators(self, responses: List[Dict], eval_scores: np.ndarray,
+                                      quality_flags: np.ndarray) -> List[str]:
         """Identify positive standout indicators"""
-        
+
         indicators = []
-        
+        count = len(responses)
+
         # Check for high scores
-        high_scores = sum(1 for r in responses if r.get("evaluation", {}).get("overall_score", 5) >= 8)
-        if high_scores >= len(responses) * 0.4:  # 40% or more high scores
+        if int((eval_scores >= 8).sum()) >= count * 0.4:  # 40% or more high scores
             indicators.append("Multiple excellent responses demonstrating strong competency")
-        
+
         # Check for technical depth
-        technical_responses = sum(1 for r in responses 
-                                if r.get("evaluation", {}).get("technical_depth", 3) >= 4)
-        if technical_responses >= len(responses) * 0.3:  # 30% or more technically strong
+        depth_scores = np.fromiter(
+            (r.get("evaluation", {}).get("technical_depth", 3) for r in responses),
+            dtype=np.float64, count=count
+        )
+        if int((depth_scores >= 4).sum()) >= count * 0.3:  # 30% or more technically strong
             indicators.append("Strong technical knowledge and depth")
-        
+
         # Check for leadership examples
-        leadership_responses = sum(1 for r in responses 
-                                 if r.get("evaluation", {}).get("shows_leadership", False))
+        leadership_responses = int(np.count_nonzero(quality_flags & FLAG_LEADERSHIP))
         if leadership_responses >= 2:
             indicators.append("Demonstrates leadership experience and skills")
-        
+
         return indicators
     
     def _generate_hiring_recommendation(self, mean_score: float, consistency: float) -> str:
@@ -526,18 +610,25 @@ class InterviewEvaluator:
             "standout_indicators": []
         }
 
+@lru_cache(maxsize=1)
+def _get_evaluator() -> InterviewEvaluator:
+    """Shared evaluator instance for the module-level convenience functions.
+
+    Construction compiles the keyword scanners, so rebuilding one per call
+    would redo that work for every response. The evaluator holds no mutable
+    state after __init__, making the shared instance thread-safe.
+    """
+    return InterviewEvaluator()
+
 # Convenience functions for easy import
 def evaluate_response(question: str, response: str, category: str, ai_evaluation: Dict) -> Dict:
     """Convenience function for response evaluation"""
-    evaluator = InterviewEvaluator()
-    return evaluator.evaluate_response_comprehensively(question, response, category, ai_evaluation)
+    return _get_evaluator().evaluate_response_comprehensively(question, response, category, ai_evaluation)
 
 def calculate_aggregate_scores(responses: List[Dict]) -> Dict:
     """Convenience function for aggregate scoring"""
-    evaluator = InterviewEvaluator()
-    return evaluator.calculate_interview_aggregate_scores(responses)
+    return _get_evaluator().calculate_interview_aggregate_scores(responses)
 
 def generate_insights(aggregate_scores: Dict) -> Dict:
     """Convenience function for insight generation"""
-    evaluator = InterviewEvaluator()
-    return evaluator.generate_scoring_insights(aggregate_scores)
+    return _get_evaluator().generate_scoring_insights(aggregate_scores)
@@ -5,8 +5,8 @@ This module provides functionality to calculate semantic similarity between
 resume content and job descriptions using sentence transformers and caching.
 """
 
+import torch
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 import hashlib
@@ -28,6 +28,15 @@ CACHE_DIR = Path(".cache/embeddings")
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 MODEL_NAME = 'all-MiniLM-L6-v2'  # Lightweight but effective model
 
+# CPU inference tuning: torch can default to a single intra-op thread in
+# containerized deployments, and encoding never needs gradients
+try:
+    torch.set_num_threads(int(os.getenv("SBERT_THREADS", str(os.cpu_count() or 4))))
+    torch.set_num_interop_threads(1)
+except RuntimeError:
+    # Thread pools already initialized (module re-import); keep them
+    pass
+
 class SemanticRanker:
     """
     A class to handle semantic similarity calculations between resumes and job descriptions.
@@ -39,6 +48,16 @@ class SemanticRanker:
         self.model_name = model_name
         try:
             self.model = SentenceTransformer(model_name)
+            self.model.eval()
+            # Transformers ships a Rust-backed tokenizer for this model;
+            # falling back to the pure-Python one makes tokenization
+            # dominate encode time for short texts, so flag it loudly
+            tokenizer = getattr(self.model, 'tokenizer', None)
+            if tokenizer is not None and not getattr(tokenizer, 'is_fast', True):
+                logger.warning(
+                    f"Slow Python tokenizer in use for {model_name}; "
+                    "install the 'tokenizers' package for the fast path"
+                )
             logger.info(f"Loaded model: {model_name}")
         except Exception as e:
             logger.error(f"Failed to load model {model_name}: {e}")
@@ -58,32 +77,45 @@ class SemanticRanker:
             text: Input text to embed
             
         Returns:
-            numpy.ndarray: Text embedding vector
+            numpy.ndarray: Unit-normalized float32 embedding vector
         """
         cache_path = self._get_cache_path(text)
-        
+
         # Try to load from cache
         if cache_path.exists():
             try:
                 embedding = np.load(cache_path)
                 logger.debug(f"Loaded embedding from cache: {cache_path}")
-                return embedding
+                return self._normalize(embedding)
             except Exception as e:
                 logger.warning(f"Error loading cached embedding: {e}")
-        
+
         # Generate and cache the embedding
         try:
-            embedding = self.model.encode(text, convert_to_tensor=False)
-            
+            # inference_mode skips autograd bookkeeping during the encode
+            with torch.inference_mode():
+                embedding = self._normalize(self.model.encode(text, convert_to_tensor=False))
+
             # Save to cache
             np.save(cache_path, embedding)
             logger.debug(f"Cached embedding to {cache_path}")
-            
+
             return embedding
-            
+
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
             raise
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        """Return the embedding as a unit-norm float32 vector.
+
+        Normalizing once here means similarity is a plain dot product and
+        float32 keeps the arrays half the size of the default float64 math.
+        Applied on cache load too, so pre-existing cache files stay valid.
+        """
+        embedding = np.asarray(embedding, dtype=np.float32)
+        return embedding / np.linalg.norm(embedding)
     
     def calculate_match_score(self, resume_data: Dict, job_description: str) -> Dict[str, float]:
         """
@@ -117,12 +149,9 @@ class SemanticRanker:
             # Join all sections
             resume_profile = ' '.join(profile_sections)
             
-            # Calculate similarity
-            resume_embedding = self.get_embedding(resume_profile).reshape(1, -1)
-            job_embedding = self.get_embedding(job_description).reshape(1, -1)
-            
-            # Calculate cosine similarity
-            similarity = float(cosine_similarity(resume_embedding, job_embedding)[0][0])
+            # Calculate cosine similarity: embeddings are unit norm, so the
+            # dot product is the cosine with no re-normalization pass
+            similarity = float(self.get_embedding(resume_profile) @ self.get_embedding(job_description))
             
             # Calculate skill match percentage
             job_desc_lower = job_description.lower()